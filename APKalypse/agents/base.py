@@ -12,6 +12,7 @@ import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field
@@ -63,9 +64,13 @@ class AgentResponse(BaseModel, Generic[OutputT]):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PromptTemplate:
-    """A versioned prompt template."""
+    """A versioned prompt template.
+
+    Frozen so the memoized content hash can't go stale; each agent shares
+    one instance across its invocations.
+    """
 
     template_id: str
     version: str
@@ -97,8 +102,9 @@ class PromptTemplate:
             prompt += f"\n\n{self.output_format_instructions}"
         return prompt
 
-    def get_hash(self) -> str:
-        """Get deterministic hash of the prompt template.
+    @cached_property
+    def content_hash(self) -> str:
+        """Deterministic hash of the prompt template, computed once.
 
         Generates a SHA-256 hash from the template ID, version, system prompt,
         and user prompt template for cache invalidation and versioning.
@@ -109,6 +115,14 @@ class PromptTemplate:
         content = f"{self.template_id}:{self.version}:{self.system_prompt}:{self.user_prompt_template}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
+    def get_hash(self) -> str:
+        """Get deterministic hash of the prompt template.
+
+        Returns:
+            str: A 16-character hexadecimal hash string.
+        """
+        return self.content_hash
+
 
 class Agent(ABC, Generic[InputT, OutputT]):
     """Base class for all APKalypse agents.
@@ -179,6 +193,18 @@ class Agent(ABC, Generic[InputT, OutputT]):
         """
         ...
 
+    @cached_property
+    def prompt_template(self) -> PromptTemplate:
+        """Prompt template for this agent, built once per agent instance.
+
+        Reusing the instance across invocations lets its memoized content
+        hash be reused as well.
+
+        Returns:
+            PromptTemplate: The template returned by get_prompt_template().
+        """
+        return self.get_prompt_template()
+
     @abstractmethod
     def prepare_input(self, input_data: InputT) -> dict[str, Any]:
         """Prepare input data for prompt rendering.
@@ -451,7 +477,7 @@ class Agent(ABC, Generic[InputT, OutputT]):
         import time
 
         start_time = time.perf_counter()
-        prompt_template = self.get_prompt_template()
+        prompt_template = self.prompt_template
 
         try:
             # Prepare prompts
@@ -35,6 +35,9 @@ class EmulatorConfig(BaseModel):
     memory_mb: int = Field(default=4096, ge=2048, description="Emulator RAM in MB")
     boot_timeout_seconds: int = Field(default=180, ge=60, description="Boot timeout")
     adb_port: int = Field(default=5554, description="ADB port")
+    emulator_count: int = Field(
+        default=1, ge=1, description="Max emulators running concurrently across workers"
+    )
 
 
 class AgentConfig(BaseModel):
@@ -155,6 +158,7 @@ class Config(BaseModel):
             emulator=EmulatorConfig(
                 headless=os.environ.get("B2B_EMULATOR_HEADLESS", "true").lower() == "true",
                 api_level=int(os.environ.get("B2B_EMULATOR_API_LEVEL", "33")),
+                emulator_count=int(os.environ.get("B2B_EMULATOR_COUNT", "1")),
             ),
             agent=AgentConfig(
                 provider=os.environ.get("B2B_AGENT_PROVIDER", "openai"),  # type: ignore
@@ -7,9 +7,14 @@ across the pipeline. Each exception type includes context for debugging and logg
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any
 
+# Transient failures worth retrying (I/O, timeouts). Anything else, such as a
+# malformed APK or unparseable manifest, fails the same way on every attempt.
+RETRYABLE_EXCEPTIONS: tuple[type[BaseException], ...] = (OSError, TimeoutError, asyncio.TimeoutError)
+
 
 @dataclass
 class APKalypseError(Exception):
@@ -103,6 +103,27 @@ class AndroidConfig(BaseModel):
     # Kotlin options
     jvm_target: str = Field(default="17")
 
+    @property
+    def gradle_values(self) -> dict[str, str]:
+        """Get config values formatted for a Gradle android block.
+
+        Returns:
+            dict[str, str]: Config field values as Gradle literals, with
+                booleans lowercased.
+        """
+        return {
+            "namespace": self.namespace,
+            "compile_sdk": str(self.compile_sdk),
+            "min_sdk": str(self.min_sdk),
+            "target_sdk": str(self.target_sdk),
+            "version_code": str(self.version_code),
+            "version_name": self.version_name,
+            "jvm_target": self.jvm_target,
+            "compose_enabled": "true" if self.compose_enabled else "false",
+            "build_config_enabled": "true" if self.build_config_enabled else "false",
+            "compose_compiler_version": self.compose_compiler_version,
+        }
+
 
 class BuildType(BaseModel):
     """Android build type configuration."""
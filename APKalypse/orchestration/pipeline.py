@@ -6,6 +6,7 @@ Implements the complete pipeline flow using Prefect for orchestration.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -34,6 +35,7 @@ from .tasks import (
     generate_code,
     verify_parity,
     check_compliance,
+    ensure_concurrency_limits,
 )
 
 
@@ -104,6 +106,8 @@ async def APKalypse_flow(config: PipelineConfig) -> PipelineResult:
     logger.info(f"App name: {config.app_name}")
 
     try:
+        await ensure_concurrency_limits()
+
         # Stage 1: Ingestion
         logger.info("Stage 1/8: Ingesting APK")
         ingestion_output = await ingest_apk(
@@ -151,6 +155,11 @@ async def APKalypse_flow(config: PipelineConfig) -> PipelineResult:
         )
         behavior_model = behavior_output.behavior_model
 
+        # The raw analysis outputs are folded into the behavior model; drop
+        # the flow's references so layouts, strings and screen lists don't
+        # stay resident through spec generation and codegen
+        del static_output, dynamic_output, behavior_output
+
         # Stage 5: Generate Specification
         logger.info("Stage 5/8: Generating specification")
         spec_output = await generate_spec(
@@ -178,26 +187,20 @@ async def APKalypse_flow(config: PipelineConfig) -> PipelineResult:
         )
         generated_project = codegen_output.project
 
-        # Stage 8: Verification
-        logger.info("Stage 8/8: Verifying parity")
-        verification_output = await verify_parity(
-            behavior_model=behavior_model,
-            generated_project=generated_project,
-            run_id=run_id,
-        )
-
-        # Compliance Check
-        logger.info("Running compliance check")
-        generated_files = {}
-        for files in generated_project.source_files.values():
-            for f in files:
-                if f.raw_content:
-                    generated_files[f.full_path] = f.raw_content
-
-        compliance_output = await check_compliance(
-            run_id=run_id,
-            apk_hash=apk_metadata.provenance.sha256_hash,
-            generated_files=generated_files,
+        # Stage 8: Verification and compliance check are independent of each
+        # other, so run them concurrently on the flow's task runner
+        logger.info("Stage 8/8: Verifying parity and checking compliance")
+        verification_output, compliance_output = await asyncio.gather(
+            verify_parity(
+                behavior_model=behavior_model,
+                generated_project=generated_project,
+                run_id=run_id,
+            ),
+            check_compliance(
+                run_id=run_id,
+                apk_hash=apk_metadata.provenance.sha256_hash,
+                generated_files_key=codegen_output.output_directory,
+            ),
         )
 
         # Build result
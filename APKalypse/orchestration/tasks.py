@@ -13,6 +13,7 @@ from typing import Any
 from prefect import task
 from prefect.logging import get_run_logger
 
+from ..core.exceptions import RETRYABLE_EXCEPTIONS, ServiceError
 from ..core.types import ServiceResult
 from ..models.apk import APKMetadata
 from ..models.behavior import BehaviorModel
@@ -38,6 +39,48 @@ from ..services.compliance import ComplianceGuard
 from ..services.compliance.service import ComplianceInput, ComplianceOutput
 from ..storage import LocalStorageBackend
 
+# Prefect tag used to throttle emulator-bound tasks. The limit itself is
+# registered with the Prefect API by ensure_concurrency_limits().
+EMULATOR_CONCURRENCY_TAG = "emulator"
+
+# Stage outputs are large, already-validated Pydantic models. Pickle restores
+# them without running validators again, whereas Prefect's JSON serializer
+# rebuilds them through model_validate. Pin pickle so a JSON default configured
+# via PREFECT_RESULTS_DEFAULT_SERIALIZER doesn't re-validate every screen and
+# transition when a persisted result is read back.
+STAGE_RESULT_SERIALIZER = "pickle"
+
+# Analysis outputs are only consumed by build_behavior_model in the same flow
+# run, where Prefect hands the Python object over by reference. Persisting
+# them would add a pickle-to-disk round trip per stage for nothing.
+HANDOFF_PERSIST_RESULT = False
+
+
+def _is_retryable_failure(task: Any, task_run: Any, state: Any) -> bool:
+    """Retry condition that skips retries for terminal failures.
+
+    Service errors carry their own retryable flag; raw I/O errors and timeouts
+    are retried. Anything else (e.g. a service-reported failure on a malformed
+    APK) would fail identically again, so it fails immediately.
+
+    Args:
+        task: The Prefect task (unused).
+        task_run: The failed task run (unused).
+        state: Failed state holding the raised exception.
+
+    Returns:
+        True if the task should be retried.
+    """
+    try:
+        state.result()
+    except ServiceError as e:
+        return e.retryable
+    except RETRYABLE_EXCEPTIONS:
+        return True
+    except Exception:
+        return False
+    return False
+
 
 def get_storage() -> LocalStorageBackend:
     """Get storage backend configured from application settings.
@@ -54,11 +97,47 @@ def get_storage() -> LocalStorageBackend:
     return LocalStorageBackend(config.storage.base_path)
 
 
+async def ensure_concurrency_limits() -> None:
+    """Register tag-based concurrency limits with the Prefect API.
+
+    Limits tasks tagged with EMULATOR_CONCURRENCY_TAG to the configured
+    emulator count so only that many emulators run at once, while untagged
+    tasks (e.g. static analysis) remain unthrottled. The limit is only
+    created when the server has none for the tag, so a limit set by an
+    operator is never overwritten. HTTP errors from the Prefect API are
+    logged and ignored since the pipeline still works without the limit.
+    """
+    from prefect.client.orchestration import get_client
+    from prefect.exceptions import ObjectNotFound, PrefectHTTPStatusError
+
+    from ..core.config import get_config
+    config = get_config()
+    logger = get_run_logger()
+
+    try:
+        async with get_client() as client:
+            try:
+                await client.read_concurrency_limit_by_tag(tag=EMULATOR_CONCURRENCY_TAG)
+            except ObjectNotFound:
+                await client.create_concurrency_limit(
+                    tag=EMULATOR_CONCURRENCY_TAG,
+                    concurrency_limit=config.emulator.emulator_count,
+                )
+                logger.info(
+                    f"Registered '{EMULATOR_CONCURRENCY_TAG}' concurrency limit of "
+                    f"{config.emulator.emulator_count}"
+                )
+    except PrefectHTTPStatusError as e:
+        logger.warning(f"Could not register '{EMULATOR_CONCURRENCY_TAG}' concurrency limit: {e}")
+
+
 @task(
     name="ingest_apk",
     description="Ingest APK and extract metadata",
     retries=2,
     retry_delay_seconds=5,
+    retry_condition_fn=_is_retryable_failure,
+    result_serializer=STAGE_RESULT_SERIALIZER,
 )
 async def ingest_apk(
     apk_path: Path,
@@ -100,6 +179,9 @@ async def ingest_apk(
     name="run_static_analysis",
     description="Run static analysis on APK",
     retries=1,
+    retry_condition_fn=_is_retryable_failure,
+    result_serializer=STAGE_RESULT_SERIALIZER,
+    persist_result=HANDOFF_PERSIST_RESULT,
 )
 async def run_static_analysis(
     apk_path: str,
@@ -107,6 +189,8 @@ async def run_static_analysis(
 ) -> StaticAnalysisOutput:
     """Run static analysis on an APK.
 
+    Concurrency: untagged, so it is never throttled by emulator limits.
+
     Args:
         apk_path: Storage key for APK
         apk_metadata: APK metadata from ingestion
@@ -139,6 +223,9 @@ async def run_static_analysis(
     description="Run dynamic analysis with emulator",
     retries=1,
     timeout_seconds=600,
+    tags=[EMULATOR_CONCURRENCY_TAG],
+    result_serializer=STAGE_RESULT_SERIALIZER,
+    persist_result=HANDOFF_PERSIST_RESULT,
 )
 async def run_dynamic_analysis(
     apk_path: str,
@@ -147,6 +234,9 @@ async def run_dynamic_analysis(
 ) -> DynamicAnalysisOutput:
     """Run dynamic analysis on an APK.
 
+    Concurrency tag: "emulator", limited to ``emulator.emulator_count``
+    concurrent runs.
+
     Args:
         apk_path: Storage key for APK
         apk_metadata: APK metadata (with manifest from static analysis)
@@ -173,8 +263,10 @@ async def run_dynamic_analysis(
         raise RuntimeError(f"Dynamic analysis failed: {result.error}")
 
     if result.warnings:
-        for warning in result.warnings:
-            logger.warning(warning)
+        # One record rather than one per warning; exploration can produce many
+        logger.warning(
+            f"Dynamic analysis reported {len(result.warnings)} warning(s):\n" + "\n".join(result.warnings)
+        )
 
     logger.info(f"Dynamic analysis complete. Found {len(result.data.screens)} screens")
     return result.data
@@ -183,6 +275,7 @@ async def run_dynamic_analysis(
 @task(
     name="build_behavior_model",
     description="Build canonical behavior model",
+    result_serializer=STAGE_RESULT_SERIALIZER,
 )
 async def build_behavior_model(
     apk_metadata: APKMetadata,
@@ -227,6 +320,7 @@ async def build_behavior_model(
 @task(
     name="generate_spec",
     description="Generate product specification",
+    result_serializer=STAGE_RESULT_SERIALIZER,
 )
 async def generate_spec(
     behavior_model: BehaviorModel,
@@ -268,6 +362,7 @@ async def generate_spec(
 @task(
     name="synthesize_architecture",
     description="Synthesize technical architecture",
+    result_serializer=STAGE_RESULT_SERIALIZER,
 )
 async def synthesize_architecture(
     behavioral_spec: BehavioralSpec,
@@ -306,6 +401,7 @@ async def synthesize_architecture(
 @task(
     name="generate_code",
     description="Generate Android application code",
+    result_serializer=STAGE_RESULT_SERIALIZER,
 )
 async def generate_code(
     behavioral_spec: BehavioralSpec,
@@ -350,6 +446,7 @@ async def generate_code(
 @task(
     name="verify_parity",
     description="Verify behavioral parity",
+    result_serializer=STAGE_RESULT_SERIALIZER,
 )
 async def verify_parity(
     behavior_model: BehaviorModel,
@@ -358,6 +455,8 @@ async def verify_parity(
 ) -> VerificationOutput:
     """Verify behavioral parity.
 
+    Never cached: every run must write its own parity report.
+
     Args:
         behavior_model: Original behavior model
         generated_project: Generated Android project
@@ -391,18 +490,23 @@ async def verify_parity(
 @task(
     name="check_compliance",
     description="Check legal compliance",
+    result_serializer=STAGE_RESULT_SERIALIZER,
 )
 async def check_compliance(
     run_id: str,
     apk_hash: str,
-    generated_files: dict[str, str],
+    generated_files_key: str,
 ) -> ComplianceOutput:
     """Check legal compliance.
 
+    Never cached: every run must persist its own report for audit_run and
+    re-check storage for persisted decompiled sources.
+
     Args:
         run_id: Pipeline run ID
         apk_hash: Original APK hash
-        generated_files: Map of file paths to content
+        generated_files_key: Storage key of the generated project; sources
+            are streamed from storage rather than passed through Prefect
 
     Returns:
         ComplianceOutput with compliance report
@@ -416,7 +520,7 @@ async def check_compliance(
     input_data = ComplianceInput(
         run_id=run_id,
         apk_hash=apk_hash,
-        generated_files=generated_files,
+        generated_files_key=generated_files_key,
     )
 
     result = await service.check(input_data)
@@ -6,10 +6,12 @@ Generates greenfield Android applications from architectural specifications.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import re
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +40,197 @@ from ...storage import StorageBackend
 logger = get_logger(__name__)
 
 
+# Separators between words in app and screen names
+_NAME_SPLIT_RE = re.compile(r'[\s_\-]+')
+
+
+# Name conversions run for the same app and screen names several times per
+# project (class names, routes, file paths), so memoize them.
+@lru_cache(maxsize=512)
+def _to_pascal_case(text: str) -> str:
+    """Convert text to PascalCase.
+
+    Args:
+        text: The input text to convert.
+
+    Returns:
+        The text converted to PascalCase format.
+    """
+    return ''.join(map(str.capitalize, _NAME_SPLIT_RE.split(text)))
+
+
+@lru_cache(maxsize=512)
+def _to_camel_case(text: str) -> str:
+    """Convert text to camelCase.
+
+    Args:
+        text: The input text to convert.
+
+    Returns:
+        The text converted to camelCase format.
+    """
+    pascal = _to_pascal_case(text)
+    return pascal[0].lower() + pascal[1:] if pascal else ""
+
+
+# Plugin and dependency declarations for the scaffolded modules. They don't
+# depend on the input, so build (and validate) the models once at import.
+_APP_PLUGINS: tuple[GradlePlugin, ...] = (
+    GradlePlugin(plugin_id="com.android.application"),
+    GradlePlugin(plugin_id="org.jetbrains.kotlin.android"),
+    GradlePlugin(plugin_id="org.jetbrains.kotlin.plugin.serialization"),
+    GradlePlugin(plugin_id="com.google.dagger.hilt.android"),
+    GradlePlugin(plugin_id="com.google.devtools.ksp"),
+)
+
+_APP_DEPENDENCIES: tuple[GradleDependency, ...] = (
+    # Core Android
+    GradleDependency(group="androidx.core", artifact="core-ktx", version="1.12.0"),
+    GradleDependency(group="androidx.lifecycle", artifact="lifecycle-runtime-ktx", version="2.6.2"),
+    GradleDependency(group="androidx.activity", artifact="activity-compose", version="1.8.2"),
+
+    # Compose - use platform() for BOM
+    GradleDependency(group="androidx.compose", artifact="compose-bom", version="2024.01.00", is_platform=True),
+    GradleDependency(group="androidx.compose.ui", artifact="ui"),
+    GradleDependency(group="androidx.compose.ui", artifact="ui-graphics"),
+    GradleDependency(group="androidx.compose.ui", artifact="ui-tooling-preview"),
+    GradleDependency(group="androidx.compose.material3", artifact="material3"),
+
+    # Navigation
+    GradleDependency(group="androidx.navigation", artifact="navigation-compose", version="2.7.6"),
+    GradleDependency(group="androidx.hilt", artifact="hilt-navigation-compose", version="1.1.0"),
+
+    # Hilt
+    GradleDependency(group="com.google.dagger", artifact="hilt-android", version="2.51.1"),
+    GradleDependency(group="com.google.dagger", artifact="hilt-compiler", version="2.51.1", scope=DependencyScope.KSP),
+
+    # ViewModel
+    GradleDependency(group="androidx.lifecycle", artifact="lifecycle-viewmodel-compose", version="2.6.2"),
+    GradleDependency(group="androidx.lifecycle", artifact="lifecycle-runtime-compose", version="2.6.2"),
+
+    # Testing
+    GradleDependency(group="junit", artifact="junit", version="4.13.2", scope=DependencyScope.TEST_IMPLEMENTATION),
+    GradleDependency(group="androidx.test.ext", artifact="junit", version="1.1.5", scope=DependencyScope.ANDROID_TEST_IMPLEMENTATION),
+)
+
+_CORE_UI_PLUGINS: tuple[GradlePlugin, ...] = (
+    GradlePlugin(plugin_id="com.android.library"),
+    GradlePlugin(plugin_id="org.jetbrains.kotlin.android"),
+)
+
+_CORE_UI_DEPENDENCIES: tuple[GradleDependency, ...] = (
+    GradleDependency(group="androidx.compose", artifact="compose-bom", version="2024.01.00", is_platform=True),
+    GradleDependency(group="androidx.compose.ui", artifact="ui"),
+    GradleDependency(group="androidx.compose.material3", artifact="material3"),
+    GradleDependency(group="androidx.compose.ui", artifact="ui-tooling-preview"),
+)
+
+_CORE_DOMAIN_PLUGINS: tuple[GradlePlugin, ...] = (
+    GradlePlugin(plugin_id="com.android.library"),
+    GradlePlugin(plugin_id="org.jetbrains.kotlin.android"),
+    GradlePlugin(plugin_id="com.google.dagger.hilt.android"),
+    GradlePlugin(plugin_id="com.google.devtools.ksp"),
+)
+
+_CORE_DOMAIN_DEPENDENCIES: tuple[GradleDependency, ...] = (
+    GradleDependency(group="javax.inject", artifact="javax.inject", version="1"),
+    GradleDependency(group="org.jetbrains.kotlinx", artifact="kotlinx-coroutines-core", version="1.7.3"),
+    GradleDependency(group="com.google.dagger", artifact="hilt-android", version="2.51.1"),
+    GradleDependency(group="com.google.dagger", artifact="hilt-compiler", version="2.51.1", scope=DependencyScope.KSP),
+)
+
+_CORE_DATA_PLUGINS: tuple[GradlePlugin, ...] = (
+    GradlePlugin(plugin_id="com.android.library"),
+    GradlePlugin(plugin_id="org.jetbrains.kotlin.android"),
+    GradlePlugin(plugin_id="org.jetbrains.kotlin.plugin.serialization"),
+    GradlePlugin(plugin_id="com.google.dagger.hilt.android"),
+    GradlePlugin(plugin_id="com.google.devtools.ksp"),
+)
+
+_CORE_DATA_DEPENDENCIES: tuple[GradleDependency, ...] = (
+    # Networking
+    GradleDependency(group="com.squareup.retrofit2", artifact="retrofit", version="2.9.0"),
+    GradleDependency(group="com.squareup.okhttp3", artifact="okhttp", version="4.12.0"),
+    GradleDependency(group="com.squareup.okhttp3", artifact="logging-interceptor", version="4.12.0"),
+    GradleDependency(group="org.jetbrains.kotlinx", artifact="kotlinx-serialization-json", version="1.6.2"),
+    GradleDependency(group="com.jakewharton.retrofit", artifact="retrofit2-kotlinx-serialization-converter", version="1.0.0"),
+
+    # Room
+    GradleDependency(group="androidx.room", artifact="room-runtime", version="2.6.1"),
+    GradleDependency(group="androidx.room", artifact="room-ktx", version="2.6.1"),
+    GradleDependency(group="androidx.room", artifact="room-compiler", version="2.6.1", scope=DependencyScope.KSP),
+
+    # DataStore
+    GradleDependency(group="androidx.datastore", artifact="datastore-preferences", version="1.0.0"),
+
+    # Hilt
+    GradleDependency(group="com.google.dagger", artifact="hilt-android", version="2.51.1"),
+    GradleDependency(group="com.google.dagger", artifact="hilt-compiler", version="2.51.1", scope=DependencyScope.KSP),
+
+    # Coroutines
+    GradleDependency(group="org.jetbrains.kotlinx", artifact="kotlinx-coroutines-core", version="1.7.3"),
+    GradleDependency(group="org.jetbrains.kotlinx", artifact="kotlinx-coroutines-android", version="1.7.3"),
+)
+
+
+# android { } block of a module build.gradle.kts. Kept as a %-template so the
+# Gradle braces need no escaping; only the config values are substituted.
+_MODULE_ANDROID_BLOCK = '''
+android {
+    namespace = "%(namespace)s"
+    compileSdk = %(compile_sdk)s
+
+    defaultConfig {
+        %(app_id_line)s
+        minSdk = %(min_sdk)s
+        %(target_sdk_line)s
+        %(version_code_line)s
+        %(version_name_line)s
+
+        testInstrumentationRunner = "androidx.test.runner.AndroidJUnitRunner"
+        vectorDrawables {
+            useSupportLibrary = true
+        }
+    }
+
+    buildTypes {
+        release {
+            isMinifyEnabled = %(minify_enabled)s
+            proguardFiles(
+                getDefaultProguardFile("proguard-android-optimize.txt"),
+                "proguard-rules.pro"
+            )
+        }
+    }
+
+    compileOptions {
+        sourceCompatibility = JavaVersion.VERSION_17
+        targetCompatibility = JavaVersion.VERSION_17
+    }
+
+    kotlinOptions {
+        jvmTarget = "%(jvm_target)s"
+    }
+
+    buildFeatures {
+        compose = %(compose_enabled)s
+        buildConfig = %(build_config_enabled)s
+    }
+
+    composeOptions {
+        kotlinCompilerExtensionVersion = "%(compose_compiler_version)s"
+    }
+
+    packaging {
+        resources {
+            excludes += "/META-INF/AL2.0"
+            excludes += "/META-INF/LGPL2.1"
+        }
+    }
+}
+'''
+
+
 class CodegenInput(BaseModel):
     """Input for code generation."""
 
@@ -59,8 +252,16 @@ class CodegenService:
 
     Generates a complete, buildable Android project from specifications.
     Code is generated fresh with no similarity to original source.
+
+    The _generate_* methods build their KotlinFile and ResourceFile results
+    with model_construct(), which skips validation: every field value comes
+    from this service, and untrusted data is validated once on CodegenInput.
+    See https://docs.pydantic.dev/latest/api/base_model/#pydantic.BaseModel.model_construct
     """
 
+    # Upper bound on generated files written to storage at once
+    MAX_CONCURRENT_WRITES = 32
+
     def __init__(self, storage: StorageBackend) -> None:
         """Initialize the codegen service.
 
@@ -171,69 +372,17 @@ kotlin.compiler.extension.version=1.5.14
         plugins_list = [f'id("{p.plugin_id}")' for p in module.plugins]
         plugins_block = "\n    ".join(plugins_list)
 
-        android_block = ""
-        if module.android_config:
-            config = module.android_config
-            app_id_line = f'applicationId = "{config.namespace}"' if is_app else ""
-            version_code_line = f"versionCode = {config.version_code}" if is_app else ""
-            version_name_line = f'versionName = "{config.version_name}"' if is_app else ""
-            # Only include targetSdk for app modules, not library modules
-            target_sdk_line = f"targetSdk = {config.target_sdk}" if is_app else ""
-            
-            android_block = f'''
-android {{
-    namespace = "{config.namespace}"
-    compileSdk = {config.compile_sdk}
-
-    defaultConfig {{
-        {app_id_line}
-        minSdk = {config.min_sdk}
-        {target_sdk_line}
-        {version_code_line}
-        {version_name_line}
-
-        testInstrumentationRunner = "androidx.test.runner.AndroidJUnitRunner"
-        vectorDrawables {{
-            useSupportLibrary = true
-        }}
-    }}
-
-    buildTypes {{
-        release {{
-            isMinifyEnabled = {"true" if is_app else "false"}
-            proguardFiles(
-                getDefaultProguardFile("proguard-android-optimize.txt"),
-                "proguard-rules.pro"
-            )
-        }}
-    }}
+        parts = ["plugins {\n    ", plugins_block, "\n}\n"]
 
-    compileOptions {{
-        sourceCompatibility = JavaVersion.VERSION_17
-        targetCompatibility = JavaVersion.VERSION_17
-    }}
-
-    kotlinOptions {{
-        jvmTarget = "{config.jvm_target}"
-    }}
-
-    buildFeatures {{
-        compose = {str(config.compose_enabled).lower()}
-        buildConfig = {str(config.build_config_enabled).lower()}
-    }}
-
-    composeOptions {{
-        kotlinCompilerExtensionVersion = "{config.compose_compiler_version}"
-    }}
-
-    packaging {{
-        resources {{
-            excludes += "/META-INF/AL2.0"
-            excludes += "/META-INF/LGPL2.1"
-        }}
-    }}
-}}
-'''
+        if module.android_config:
+            values = module.android_config.gradle_values
+            # Only app modules set an application ID, version and targetSdk
+            values["app_id_line"] = f'applicationId = "{values["namespace"]}"' if is_app else ""
+            values["target_sdk_line"] = f"targetSdk = {values['target_sdk']}" if is_app else ""
+            values["version_code_line"] = f"versionCode = {values['version_code']}" if is_app else ""
+            values["version_name_line"] = f'versionName = "{values["version_name"]}"' if is_app else ""
+            values["minify_enabled"] = "true" if is_app else "false"
+            parts.append(_MODULE_ANDROID_BLOCK % values)
 
         deps_list = [d.declaration for d in module.dependencies]
         deps_block = "\n    ".join(deps_list)
@@ -241,15 +390,8 @@ android {{
         module_deps_list = [f'implementation(project("{dep}"))' for dep in module.module_dependencies]
         module_deps = "\n    ".join(module_deps_list)
 
-        return f'''plugins {{
-    {plugins_block}
-}}
-{android_block}
-dependencies {{
-    {deps_block}
-    {module_deps}
-}}
-'''
+        parts += ["\ndependencies {\n    ", deps_block, "\n    ", module_deps, "\n}\n"]
+        return "".join(parts)
 
     def _create_app_module(self, package_name: str) -> GradleModule:
         """Create the main app module.
@@ -270,42 +412,8 @@ dependencies {{
                 min_sdk=24,
                 target_sdk=34,
             ),
-            plugins=[
-                GradlePlugin(plugin_id="com.android.application"),
-                GradlePlugin(plugin_id="org.jetbrains.kotlin.android"),
-                GradlePlugin(plugin_id="org.jetbrains.kotlin.plugin.serialization"),
-                GradlePlugin(plugin_id="com.google.dagger.hilt.android"),
-                GradlePlugin(plugin_id="com.google.devtools.ksp"),
-            ],
-            dependencies=[
-                # Core Android
-                GradleDependency(group="androidx.core", artifact="core-ktx", version="1.12.0"),
-                GradleDependency(group="androidx.lifecycle", artifact="lifecycle-runtime-ktx", version="2.6.2"),
-                GradleDependency(group="androidx.activity", artifact="activity-compose", version="1.8.2"),
-
-                # Compose - use platform() for BOM
-                GradleDependency(group="androidx.compose", artifact="compose-bom", version="2024.01.00", is_platform=True),
-                GradleDependency(group="androidx.compose.ui", artifact="ui"),
-                GradleDependency(group="androidx.compose.ui", artifact="ui-graphics"),
-                GradleDependency(group="androidx.compose.ui", artifact="ui-tooling-preview"),
-                GradleDependency(group="androidx.compose.material3", artifact="material3"),
-
-                # Navigation
-                GradleDependency(group="androidx.navigation", artifact="navigation-compose", version="2.7.6"),
-                GradleDependency(group="androidx.hilt", artifact="hilt-navigation-compose", version="1.1.0"),
-
-                # Hilt
-                GradleDependency(group="com.google.dagger", artifact="hilt-android", version="2.51.1"),
-                GradleDependency(group="com.google.dagger", artifact="hilt-compiler", version="2.51.1", scope=DependencyScope.KSP),
-
-                # ViewModel
-                GradleDependency(group="androidx.lifecycle", artifact="lifecycle-viewmodel-compose", version="2.6.2"),
-                GradleDependency(group="androidx.lifecycle", artifact="lifecycle-runtime-compose", version="2.6.2"),
-
-                # Testing
-                GradleDependency(group="junit", artifact="junit", version="4.13.2", scope=DependencyScope.TEST_IMPLEMENTATION),
-                GradleDependency(group="androidx.test.ext", artifact="junit", version="1.1.5", scope=DependencyScope.ANDROID_TEST_IMPLEMENTATION),
-            ],
+            plugins=list(_APP_PLUGINS),
+            dependencies=list(_APP_DEPENDENCIES),
             module_dependencies=[":core:ui", ":core:domain"],
         )
 
@@ -326,16 +434,8 @@ dependencies {{
                 namespace=f"{package_name}.core.ui",
                 compose_enabled=True,
             ),
-            plugins=[
-                GradlePlugin(plugin_id="com.android.library"),
-                GradlePlugin(plugin_id="org.jetbrains.kotlin.android"),
-            ],
-            dependencies=[
-                GradleDependency(group="androidx.compose", artifact="compose-bom", version="2024.01.00", is_platform=True),
-                GradleDependency(group="androidx.compose.ui", artifact="ui"),
-                GradleDependency(group="androidx.compose.material3", artifact="material3"),
-                GradleDependency(group="androidx.compose.ui", artifact="ui-tooling-preview"),
-            ],
+            plugins=list(_CORE_UI_PLUGINS),
+            dependencies=list(_CORE_UI_DEPENDENCIES),
         )
 
     def _create_core_domain_module(self, package_name: str) -> GradleModule:
@@ -355,18 +455,8 @@ dependencies {{
                 namespace=f"{package_name}.core.domain",
                 compose_enabled=False,
             ),
-            plugins=[
-                GradlePlugin(plugin_id="com.android.library"),
-                GradlePlugin(plugin_id="org.jetbrains.kotlin.android"),
-                GradlePlugin(plugin_id="com.google.dagger.hilt.android"),
-                GradlePlugin(plugin_id="com.google.devtools.ksp"),
-            ],
-            dependencies=[
-                GradleDependency(group="javax.inject", artifact="javax.inject", version="1"),
-                GradleDependency(group="org.jetbrains.kotlinx", artifact="kotlinx-coroutines-core", version="1.7.3"),
-                GradleDependency(group="com.google.dagger", artifact="hilt-android", version="2.51.1"),
-                GradleDependency(group="com.google.dagger", artifact="hilt-compiler", version="2.51.1", scope=DependencyScope.KSP),
-            ],
+            plugins=list(_CORE_DOMAIN_PLUGINS),
+            dependencies=list(_CORE_DOMAIN_DEPENDENCIES),
             module_dependencies=[":core:data"],
         )
 
@@ -387,51 +477,24 @@ dependencies {{
                 namespace=f"{package_name}.core.data",
                 compose_enabled=False,
             ),
-            plugins=[
-                GradlePlugin(plugin_id="com.android.library"),
-                GradlePlugin(plugin_id="org.jetbrains.kotlin.android"),
-                GradlePlugin(plugin_id="org.jetbrains.kotlin.plugin.serialization"),
-                GradlePlugin(plugin_id="com.google.dagger.hilt.android"),
-                GradlePlugin(plugin_id="com.google.devtools.ksp"),
-            ],
-            dependencies=[
-                # Networking
-                GradleDependency(group="com.squareup.retrofit2", artifact="retrofit", version="2.9.0"),
-                GradleDependency(group="com.squareup.okhttp3", artifact="okhttp", version="4.12.0"),
-                GradleDependency(group="com.squareup.okhttp3", artifact="logging-interceptor", version="4.12.0"),
-                GradleDependency(group="org.jetbrains.kotlinx", artifact="kotlinx-serialization-json", version="1.6.2"),
-                GradleDependency(group="com.jakewharton.retrofit", artifact="retrofit2-kotlinx-serialization-converter", version="1.0.0"),
-
-                # Room
-                GradleDependency(group="androidx.room", artifact="room-runtime", version="2.6.1"),
-                GradleDependency(group="androidx.room", artifact="room-ktx", version="2.6.1"),
-                GradleDependency(group="androidx.room", artifact="room-compiler", version="2.6.1", scope=DependencyScope.KSP),
-
-                # DataStore
-                GradleDependency(group="androidx.datastore", artifact="datastore-preferences", version="1.0.0"),
-
-                # Hilt
-                GradleDependency(group="com.google.dagger", artifact="hilt-android", version="2.51.1"),
-                GradleDependency(group="com.google.dagger", artifact="hilt-compiler", version="2.51.1", scope=DependencyScope.KSP),
-
-                # Coroutines
-                GradleDependency(group="org.jetbrains.kotlinx", artifact="kotlinx-coroutines-core", version="1.7.3"),
-                GradleDependency(group="org.jetbrains.kotlinx", artifact="kotlinx-coroutines-android", version="1.7.3"),
-            ],
+            plugins=list(_CORE_DATA_PLUGINS),
+            dependencies=list(_CORE_DATA_DEPENDENCIES),
         )
 
-    def _generate_application_class(self, package_name: str, app_name: str) -> KotlinFile:
+    def _generate_application_class(
+        self, package_name: str, pkg_path: str, app_name: str, app_class: str
+    ) -> KotlinFile:
         """Generate the Application class.
 
         Args:
             package_name: The base package name for the application.
+            pkg_path: The package name as a directory path.
             app_name: The display name of the application.
+            app_class: The Application class name.
 
         Returns:
             A KotlinFile containing the Hilt-annotated Application class.
         """
-        class_name = self._to_pascal_case(app_name) + "Application"
-
         content = f'''package {package_name}
 
 import android.app.Application
@@ -442,7 +505,7 @@ import dagger.hilt.android.HiltAndroidApp
  * Annotated with @HiltAndroidApp to enable Hilt dependency injection.
  */
 @HiltAndroidApp
-class {class_name} : Application() {{
+class {app_class} : Application() {{
 
     override fun onCreate() {{
         super.onCreate()
@@ -451,18 +514,19 @@ class {class_name} : Application() {{
 }}
 '''
 
-        return KotlinFile(
-            file_name=class_name,
+        return KotlinFile.model_construct(
+            file_name=app_class,
             package=package_name,
-            relative_path=f"app/src/main/kotlin/{package_name.replace('.', '/')}",
+            relative_path=f"app/src/main/kotlin/{pkg_path}",
             raw_content=content,
         )
 
-    def _generate_main_activity(self, package_name: str, app_name: str) -> KotlinFile:
+    def _generate_main_activity(self, package_name: str, pkg_path: str, app_name: str) -> KotlinFile:
         """Generate the MainActivity.
 
         Args:
             package_name: The base package name for the application.
+            pkg_path: The package name as a directory path.
             app_name: The display name of the application.
 
         Returns:
@@ -503,18 +567,19 @@ class MainActivity : ComponentActivity() {{
 }}
 '''
 
-        return KotlinFile(
+        return KotlinFile.model_construct(
             file_name="MainActivity",
             package=package_name,
-            relative_path=f"app/src/main/kotlin/{package_name.replace('.', '/')}",
+            relative_path=f"app/src/main/kotlin/{pkg_path}",
             raw_content=content,
         )
 
-    def _generate_navigation(self, package_name: str, screens: list[Any]) -> KotlinFile:
+    def _generate_navigation(self, package_name: str, pkg_path: str, screens: list[Any]) -> KotlinFile:
         """Generate the navigation graph.
 
         Args:
             package_name: The base package name for the application.
+            pkg_path: The package name as a directory path.
             screens: List of screen specifications to include in navigation.
 
         Returns:
@@ -524,8 +589,11 @@ class MainActivity : ComponentActivity() {{
         screen_composables = []
 
         for screen in screens[:10]:  # Limit to 10 screens
-            route_name = self._to_camel_case(screen.screen_name)
-            screen_name = self._to_pascal_case(screen.screen_name) + "Screen"
+            # Both converters are memoized, so the camelCase call reuses the
+            # PascalCase conversion rather than redoing it
+            pascal_name = _to_pascal_case(screen.screen_name)
+            route_name = _to_camel_case(screen.screen_name)
+            screen_name = pascal_name + "Screen"
 
             screen_routes.append(f'    const val {route_name} = "{route_name}"')
             screen_composables.append(f'''        composable(Routes.{route_name}) {{
@@ -571,18 +639,19 @@ fun AppNavigation() {{
 }}
 '''
 
-        return KotlinFile(
+        return KotlinFile.model_construct(
             file_name="AppNavigation",
             package=f"{package_name}.navigation",
-            relative_path=f"app/src/main/kotlin/{package_name.replace('.', '/')}/navigation",
+            relative_path=f"app/src/main/kotlin/{pkg_path}/navigation",
             raw_content=content,
         )
 
-    def _generate_theme(self, package_name: str) -> KotlinFile:
+    def _generate_theme(self, package_name: str, pkg_path: str) -> KotlinFile:
         """Generate the theme file.
 
         Args:
             package_name: The base package name for the application.
+            pkg_path: The package name as a directory path.
 
         Returns:
             A KotlinFile containing the Material3 theme composable.
@@ -651,18 +720,19 @@ fun AppTheme(
 }}
 '''
 
-        return KotlinFile(
+        return KotlinFile.model_construct(
             file_name="Theme",
             package=f"{package_name}.core.ui.theme",
-            relative_path=f"core/ui/src/main/kotlin/{package_name.replace('.', '/')}/core/ui/theme",
+            relative_path=f"core/ui/src/main/kotlin/{pkg_path}/core/ui/theme",
             raw_content=content,
         )
 
-    def _generate_color(self, package_name: str) -> KotlinFile:
+    def _generate_color(self, package_name: str, pkg_path: str) -> KotlinFile:
         """Generate the color file.
 
         Args:
             package_name: The base package name for the application.
+            pkg_path: The package name as a directory path.
 
         Returns:
             A KotlinFile containing the color palette definitions.
@@ -680,18 +750,19 @@ val PurpleGrey40 = Color(0xFF625b71)
 val Pink40 = Color(0xFF7D5260)
 '''
 
-        return KotlinFile(
+        return KotlinFile.model_construct(
             file_name="Color",
             package=f"{package_name}.core.ui.theme",
-            relative_path=f"core/ui/src/main/kotlin/{package_name.replace('.', '/')}/core/ui/theme",
+            relative_path=f"core/ui/src/main/kotlin/{pkg_path}/core/ui/theme",
             raw_content=content,
         )
 
-    def _generate_typography(self, package_name: str) -> KotlinFile:
+    def _generate_typography(self, package_name: str, pkg_path: str) -> KotlinFile:
         """Generate the typography file.
 
         Args:
             package_name: The base package name for the application.
+            pkg_path: The package name as a directory path.
 
         Returns:
             A KotlinFile containing the typography style definitions.
@@ -729,18 +800,19 @@ val Typography = Typography(
 )
 '''
 
-        return KotlinFile(
+        return KotlinFile.model_construct(
             file_name="Typography",
             package=f"{package_name}.core.ui.theme",
-            relative_path=f"core/ui/src/main/kotlin/{package_name.replace('.', '/')}/core/ui/theme",
+            relative_path=f"core/ui/src/main/kotlin/{pkg_path}/core/ui/theme",
             raw_content=content,
         )
 
-    def _generate_home_screen(self, package_name: str, app_name: str) -> KotlinFile:
+    def _generate_home_screen(self, package_name: str, pkg_path: str, app_name: str) -> KotlinFile:
         """Generate the home screen.
 
         Args:
             package_name: The base package name for the application.
+            pkg_path: The package name as a directory path.
             app_name: The display name of the application.
 
         Returns:
@@ -831,18 +903,19 @@ private fun HomeScreenPreview() {{
 }}
 '''
 
-        return KotlinFile(
+        return KotlinFile.model_construct(
             file_name="HomeScreen",
             package=f"{package_name}.feature.home",
-            relative_path=f"app/src/main/kotlin/{package_name.replace('.', '/')}/feature/home",
+            relative_path=f"app/src/main/kotlin/{pkg_path}/feature/home",
             raw_content=content,
         )
 
-    def _generate_home_viewmodel(self, package_name: str) -> KotlinFile:
+    def _generate_home_viewmodel(self, package_name: str, pkg_path: str) -> KotlinFile:
         """Generate the home view model.
 
         Args:
             package_name: The base package name for the application.
+            pkg_path: The package name as a directory path.
 
         Returns:
             A KotlinFile containing the HomeViewModel with UI state management.
@@ -904,25 +977,23 @@ class HomeViewModel @Inject constructor() : ViewModel() {{
 }}
 '''
 
-        return KotlinFile(
+        return KotlinFile.model_construct(
             file_name="HomeViewModel",
             package=f"{package_name}.feature.home",
-            relative_path=f"app/src/main/kotlin/{package_name.replace('.', '/')}/feature/home",
+            relative_path=f"app/src/main/kotlin/{pkg_path}/feature/home",
             raw_content=content,
         )
 
-    def _generate_manifest(self, package_name: str, app_name: str) -> ResourceFile:
+    def _generate_manifest(self, package_name: str, app_class: str) -> ResourceFile:
         """Generate AndroidManifest.xml.
 
         Args:
             package_name: The base package name for the application.
-            app_name: The display name of the application.
+            app_class: The Application class name the manifest registers.
 
         Returns:
             A ResourceFile containing the AndroidManifest.xml content.
         """
-        app_class = self._to_pascal_case(app_name) + "Application"
-
         content = f'''<?xml version="1.0" encoding="utf-8"?>
 <manifest xmlns:android="http://schemas.android.com/apk/res/android">
 
@@ -953,7 +1024,7 @@ class HomeViewModel @Inject constructor() : ViewModel() {{
 </manifest>
 '''
 
-        return ResourceFile(
+        return ResourceFile.model_construct(
             resource_type=ResourceType.XML,
             file_name="AndroidManifest.xml",
             content=content,
@@ -974,7 +1045,7 @@ class HomeViewModel @Inject constructor() : ViewModel() {{
 </resources>
 '''
 
-        return ResourceFile(
+        return ResourceFile.model_construct(
             resource_type=ResourceType.VALUES,
             file_name="strings.xml",
             content=content,
@@ -992,7 +1063,7 @@ class HomeViewModel @Inject constructor() : ViewModel() {{
 </resources>
 '''
 
-        return ResourceFile(
+        return ResourceFile.model_construct(
             resource_type=ResourceType.VALUES,
             file_name="themes.xml",
             content=content,
@@ -1007,8 +1078,7 @@ class HomeViewModel @Inject constructor() : ViewModel() {{
         Returns:
             The text converted to PascalCase format.
         """
-        words = re.split(r'[\s_\-]+', text)
-        return ''.join(word.capitalize() for word in words)
+        return _to_pascal_case(text)
 
     def _to_camel_case(self, text: str) -> str:
         """Convert text to camelCase.
@@ -1019,8 +1089,7 @@ class HomeViewModel @Inject constructor() : ViewModel() {{
         Returns:
             The text converted to camelCase format.
         """
-        pascal = self._to_pascal_case(text)
-        return pascal[0].lower() + pascal[1:] if pascal else ""
+        return _to_camel_case(text)
 
     async def generate(self, input_data: CodegenInput) -> ServiceResult[CodegenOutput]:
         """Generate Android application.
@@ -1040,6 +1109,10 @@ class HomeViewModel @Inject constructor() : ViewModel() {{
 
             package_name = input_data.package_name
             app_name = input_data.behavioral_spec.app_name
+            # Source directory path for the package, shared by every source file
+            pkg_path = package_name.replace(".", "/")
+            # The Application class and the manifest entry must name the same class
+            app_class = f"{_to_pascal_case(app_name)}Application"
 
             # Create modules
             modules = [
@@ -1067,22 +1140,22 @@ class HomeViewModel @Inject constructor() : ViewModel() {{
             source_files: dict[str, list[KotlinFile]] = {":app": [], ":core:ui": []}
 
             # App module sources
-            source_files[":app"].append(self._generate_application_class(package_name, app_name))
-            source_files[":app"].append(self._generate_main_activity(package_name, app_name))
-            source_files[":app"].append(self._generate_navigation(package_name, input_data.behavioral_spec.screen_specs))
-            source_files[":app"].append(self._generate_home_screen(package_name, app_name))
-            source_files[":app"].append(self._generate_home_viewmodel(package_name))
+            source_files[":app"].append(self._generate_application_class(package_name, pkg_path, app_name, app_class))
+            source_files[":app"].append(self._generate_main_activity(package_name, pkg_path, app_name))
+            source_files[":app"].append(self._generate_navigation(package_name, pkg_path, input_data.behavioral_spec.screen_specs))
+            source_files[":app"].append(self._generate_home_screen(package_name, pkg_path, app_name))
+            source_files[":app"].append(self._generate_home_viewmodel(package_name, pkg_path))
 
             # Core UI sources
-            source_files[":core:ui"].append(self._generate_theme(package_name))
-            source_files[":core:ui"].append(self._generate_color(package_name))
-            source_files[":core:ui"].append(self._generate_typography(package_name))
+            source_files[":core:ui"].append(self._generate_theme(package_name, pkg_path))
+            source_files[":core:ui"].append(self._generate_color(package_name, pkg_path))
+            source_files[":core:ui"].append(self._generate_typography(package_name, pkg_path))
 
             project.source_files = source_files
 
             # Generate resource files
             resource_files: dict[str, list[ResourceFile]] = {":app": []}
-            resource_files[":app"].append(self._generate_manifest(package_name, app_name))
+            resource_files[":app"].append(self._generate_manifest(package_name, app_class))
             resource_files[":app"].append(self._generate_strings_xml(app_name))
             resource_files[":app"].append(self._generate_themes_xml())
 
@@ -1467,34 +1540,31 @@ exec "$JAVACMD" "$@"
             output_dir: The storage directory path for the generated files.
         """
         # Root files
-        await self.storage.store_text(f"{output_dir}/build.gradle.kts", project.root_build_gradle)
-        await self.storage.store_text(f"{output_dir}/settings.gradle.kts", project.settings_gradle)
-        await self.storage.store_text(f"{output_dir}/gradle.properties", project.gradle_properties)
+        text_files: list[tuple[str, str]] = [
+            (f"{output_dir}/build.gradle.kts", project.root_build_gradle),
+            (f"{output_dir}/settings.gradle.kts", project.settings_gradle),
+            (f"{output_dir}/gradle.properties", project.gradle_properties),
+        ]
 
         # Gradle wrapper files
-        await self.storage.store_text(
+        text_files.append((
             f"{output_dir}/gradle/wrapper/gradle-wrapper.properties",
-            self._create_gradle_wrapper_properties(project.gradle_version)
-        )
-        await self.storage.store_text(f"{output_dir}/gradlew", self._create_gradlew())
-        await self.storage.store_text(f"{output_dir}/gradlew.bat", self._create_gradlew_bat())
-        
-        # Download and store gradle-wrapper.jar
-        wrapper_jar = await self._download_gradle_wrapper_jar(project.gradle_version)
-        if wrapper_jar:
-            await self.storage.store_bytes(f"{output_dir}/gradle/wrapper/gradle-wrapper.jar", wrapper_jar)
+            self._create_gradle_wrapper_properties(project.gradle_version),
+        ))
+        text_files.append((f"{output_dir}/gradlew", self._create_gradlew()))
+        text_files.append((f"{output_dir}/gradlew.bat", self._create_gradlew_bat()))
 
         # Module build files
         for module in project.modules:
             build_content = self._create_module_build_gradle(module, project.package_name)
-            await self.storage.store_text(f"{output_dir}/{module.module_path}/build.gradle.kts", build_content)
+            text_files.append((f"{output_dir}/{module.module_path}/build.gradle.kts", build_content))
 
         # Source files
         for module_name, files in project.source_files.items():
             for kotlin_file in files:
                 if kotlin_file.raw_content:
                     path = f"{output_dir}/{kotlin_file.relative_path}/{kotlin_file.file_name}.kt"
-                    await self.storage.store_text(path, kotlin_file.raw_content)
+                    text_files.append((path, kotlin_file.raw_content))
 
         # Resource files
         for module_name, files in project.resource_files.items():
@@ -1507,7 +1577,24 @@ exec "$JAVACMD" "$@"
                     path = f"{output_dir}/{module.module_path}/src/main/AndroidManifest.xml"
                 else:
                     path = f"{output_dir}/{module.module_path}/src/main/res/{resource_file.directory_name}/{resource_file.file_name}"
-                await self.storage.store_text(path, resource_file.content)
+                text_files.append((path, resource_file.content))
+
+        # The files are independent, so write them concurrently rather than
+        # one round trip at a time, capped to avoid flooding the backend.
+        # Nothing reads per-file metadata of generated files (project.json
+        # describes the project), so skip the sidecar writes.
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_WRITES)
+
+        async def store(path: str, content: str) -> None:
+            async with semaphore:
+                await self.storage.store_text(path, content, skip_metadata=True)
+
+        await asyncio.gather(*(store(path, content) for path, content in text_files))
+
+        # Download and store gradle-wrapper.jar
+        wrapper_jar = await self._download_gradle_wrapper_jar(project.gradle_version)
+        if wrapper_jar:
+            await self.storage.store_bytes(f"{output_dir}/gradle/wrapper/gradle-wrapper.jar", wrapper_jar)
 
         # Store project model
         await self.storage.store_model(f"{output_dir}/project.json", project)
@@ -6,9 +6,11 @@ Ensures legal safety by preventing source code reuse and tracking artifact prove
 
 from __future__ import annotations
 
+import contextlib
 import difflib
 import hashlib
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -63,7 +65,10 @@ class ComplianceInput(BaseModel):
 
     run_id: str
     apk_hash: str = Field(description="Original APK hash")
-    generated_files: dict[str, str] = Field(description="Map of file paths to content")
+    generated_files: dict[str, str] = Field(default_factory=dict, description="Map of file paths to content")
+    generated_files_key: str | None = Field(
+        default=None, description="Storage key of a generated project whose sources are streamed from storage"
+    )
     decompiled_artifacts: list[str] = Field(default_factory=list, description="Paths to decompiled artifacts to check")
 
 
@@ -94,6 +99,9 @@ class ComplianceGuard:
         self.storage = storage
         self.config = get_config().compliance
 
+    # Generated source files streamed from generated_files_key
+    SOURCE_SUFFIXES = (".kt",)
+
     # Patterns that indicate code copying
     SUSPICIOUS_PATTERNS = [
         r'// This code was generated by \w+',
@@ -105,6 +113,13 @@ class ComplianceGuard:
         r'// CFR decompiler',
     ]
 
+    # Compiled once per process. The combined alternation lets clean files,
+    # the common case, be cleared in a single pass over their content.
+    _SUSPICIOUS_REGEXES = [(p, re.compile(p, re.IGNORECASE)) for p in SUSPICIOUS_PATTERNS]
+    _ANY_SUSPICIOUS_REGEX = re.compile(
+        "|".join(f"(?:{p})" for p in SUSPICIOUS_PATTERNS), re.IGNORECASE
+    )
+
     def _normalize_code(self, code: str) -> str:
         """Normalize code for comparison.
 
@@ -163,11 +178,12 @@ class ComplianceGuard:
         Returns:
             List of suspicious regex patterns that were matched.
         """
-        found = []
-        for pattern in self.SUSPICIOUS_PATTERNS:
-            if re.search(pattern, content, re.IGNORECASE):
-                found.append(pattern)
-        return found
+        if not self._ANY_SUSPICIOUS_REGEX.search(content):
+            return []
+
+        # Patterns can overlap (e.g. "/* jadx */" matches two of them), so
+        # resolve which ones hit individually
+        return [pattern for pattern, regex in self._SUSPICIOUS_REGEXES if regex.search(content)]
 
     def _compute_content_hash(self, content: str) -> str:
         """Compute hash of content.
@@ -180,6 +196,26 @@ class ComplianceGuard:
         """
         return hashlib.sha256(content.encode()).hexdigest()
 
+    async def _iter_generated_files(self, input_data: ComplianceInput) -> AsyncIterator[tuple[str, str]]:
+        """Iterate over the generated files to check.
+
+        Yields in-memory files first, then streams sources from storage one
+        at a time when a generated project key is given.
+
+        Args:
+            input_data: Compliance check input.
+
+        Yields:
+            Tuples of (project-relative file path, content).
+        """
+        for file_path, content in input_data.generated_files.items():
+            yield file_path, content
+
+        if input_data.generated_files_key:
+            prefix = input_data.generated_files_key.rstrip("/") + "/"
+            async for key, content in self.storage.iter_text(prefix, self.SOURCE_SUFFIXES):
+                yield key[len(prefix):], content
+
     async def check_artifact_similarity(
         self,
         generated_content: str,
@@ -335,43 +371,39 @@ class ComplianceGuard:
             max_similarity = 0.0
             artifacts_checked = 0
             similarity_checks = 0
+            output_hashes: dict[str, str] = {}
+
+            # The decompiled samples are the same for every generated file,
+            # so load them once up front rather than per file
+            decompiled_samples: list[str] = []
+            for artifact_path in input_data.decompiled_artifacts[:5]:  # Limit checks
+                with contextlib.suppress(FileNotFoundError):
+                    decompiled_samples.append(await self.storage.load_text(artifact_path))
 
             # Check each generated file
-            for file_path, content in input_data.generated_files.items():
+            async for file_path, content in self._iter_generated_files(input_data):
                 artifacts_checked += 1
 
+                # Compute output hash for provenance
+                output_hashes[file_path] = self._compute_content_hash(content)
+
                 # Check for suspicious patterns
                 pattern_violations = await self.check_suspicious_content(content, file_path)
                 all_violations.extend(pattern_violations)
 
                 # Check similarity against decompiled samples (if available)
-                if input_data.decompiled_artifacts:
-                    decompiled_samples = []
-                    for artifact_path in input_data.decompiled_artifacts[:5]:  # Limit checks
-                        try:
-                            sample = await self.storage.load_text(artifact_path)
-                            decompiled_samples.append(sample)
-                        except FileNotFoundError:
-                            pass
-
-                    if decompiled_samples:
-                        similarity, sim_violations = await self.check_artifact_similarity(
-                            content, decompiled_samples, file_path
-                        )
-                        max_similarity = max(max_similarity, similarity)
-                        all_violations.extend(sim_violations)
-                        similarity_checks += len(decompiled_samples)
+                if decompiled_samples:
+                    similarity, sim_violations = await self.check_artifact_similarity(
+                        content, decompiled_samples, file_path
+                    )
+                    max_similarity = max(max_similarity, similarity)
+                    all_violations.extend(sim_violations)
+                    similarity_checks += len(decompiled_samples)
 
             # Check for persisted decompiled source
             persist_violations = await self.verify_no_source_persisted(f"apks/{input_data.apk_hash}")
             all_violations.extend(persist_violations)
 
-            # Compute output hashes for provenance
-            output_hashes = {
-                path: self._compute_content_hash(content)
-                for path, content in input_data.generated_files.items()
-            }
-
             # Determine pass/fail
             critical_violations = [v for v in all_violations if v.severity == "critical"]
             passed = len(critical_violations) == 0
@@ -6,19 +6,23 @@ Handles APK intake, normalization, hash computation, and provenance tracking.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import mmap
+import os
 import re
 import subprocess
 import tempfile
 import xml.etree.ElementTree as ET
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
-from ...core.exceptions import ServiceError, ValidationError
+from ...core.exceptions import RETRYABLE_EXCEPTIONS, ServiceError, ValidationError
 from ...core.logging import get_logger
 from ...core.types import ServiceResult
 from ...models.apk import APKMetadata, APKProvenance, ManifestData, PlayStoreMetadata
@@ -55,6 +59,17 @@ class IngestionService:
     5. Creates provenance records
     """
 
+    # Substrings of APK entry names that reveal an embedded library, mapped to
+    # the library reported for them (in reporting order)
+    _LIBRARY_MARKERS = {
+        "kotlin": "kotlin",
+        "okhttp": "okhttp",
+        "retrofit": "retrofit",
+        "rxjava": "rxjava",
+        "rxandroid": "rxjava",
+    }
+    _LIBRARY_MARKER_REGEX = re.compile("|".join(_LIBRARY_MARKERS), re.IGNORECASE)
+
     def __init__(self, storage: StorageBackend) -> None:
         """Initialize the ingestion service.
 
@@ -77,14 +92,19 @@ class IngestionService:
         md5 = hashlib.md5()
 
         with open(file_path, "rb") as f:
-            while chunk := f.read(8192):
-                sha256.update(chunk)
-                sha1.update(chunk)
-                md5.update(chunk)
+            # mmap can't map an empty file, whose digests are already final
+            if os.fstat(f.fileno()).st_size:
+                # hashlib releases the GIL while hashing large buffers, so the
+                # three digests run on separate cores over the same mapped file
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                with mm, memoryview(mm) as view, ThreadPoolExecutor(max_workers=3) as executor:
+                    futures = [executor.submit(h.update, view) for h in (sha256, sha1, md5)]
+                    for future in futures:
+                        future.result()
 
         return sha256.hexdigest(), sha1.hexdigest(), md5.hexdigest()
 
-    def _validate_apk(self, apk_path: Path) -> None:
+    def _validate_apk(self, apk_path: Path) -> list[zipfile.ZipInfo]:
         """Validate that the file is a valid APK.
 
         Checks that the file exists, has an .apk extension, is a valid ZIP archive,
@@ -93,79 +113,113 @@ class IngestionService:
         Args:
             apk_path: Path to the APK file to validate.
 
+        Returns:
+            The APK's ZIP entries, for reuse by later steps.
+
         Raises:
             ValidationError: If the APK is invalid or missing required files.
         """
-        if not apk_path.exists():
-            raise ValidationError(
-                message=f"APK file not found: {apk_path}",
-                field_name="apk_path",
-            )
-
         if not apk_path.suffix.lower() == ".apk":
+            # Only stat on this rejection path, so a missing file is still
+            # reported as missing whatever its extension
+            if not apk_path.exists():
+                raise ValidationError(
+                    message=f"APK file not found: {apk_path}",
+                    field_name="apk_path",
+                )
             raise ValidationError(
                 message=f"File is not an APK: {apk_path}",
                 field_name="apk_path",
             )
 
-        # Verify it's a valid ZIP file (APKs are ZIP archives)
+        # Verify it's a valid ZIP file (APKs are ZIP archives). Opening it also
+        # tells us whether it exists, without a separate stat.
         try:
             with zipfile.ZipFile(apk_path, "r") as zf:
-                # Check for required APK files
-                names = zf.namelist()
-                if "AndroidManifest.xml" not in names:
-                    raise ValidationError(
-                        message="Invalid APK: missing AndroidManifest.xml",
-                        field_name="apk_path",
-                    )
-                if "classes.dex" not in names and not any(n.startswith("classes") and n.endswith(".dex") for n in names):
-                    raise ValidationError(
-                        message="Invalid APK: missing DEX files",
-                        field_name="apk_path",
-                    )
+                # infolist() is the parsed central directory itself, so no
+                # per-entry list is built as with namelist()
+                entries = zf.infolist()
+                has_manifest = True
+                try:
+                    zf.getinfo("AndroidManifest.xml")
+                except KeyError:
+                    has_manifest = False
+        except FileNotFoundError as e:
+            raise ValidationError(
+                message=f"APK file not found: {apk_path}",
+                field_name="apk_path",
+            ) from e
         except zipfile.BadZipFile:
             raise ValidationError(
                 message="Invalid APK: not a valid ZIP archive",
                 field_name="apk_path",
             )
 
-    def _extract_basic_info(self, apk_path: Path) -> dict[str, Any]:
+        # Check for required APK files
+        if not has_manifest:
+            raise ValidationError(
+                message="Invalid APK: missing AndroidManifest.xml",
+                field_name="apk_path",
+            )
+        if not any(e.filename.startswith("classes") and e.filename.endswith(".dex") for e in entries):
+            raise ValidationError(
+                message="Invalid APK: missing DEX files",
+                field_name="apk_path",
+            )
+
+        return entries
+
+    def _extract_basic_info(
+        self, apk_path: Path, file_size: int, entries: list[zipfile.ZipInfo]
+    ) -> dict[str, Any]:
         """Extract basic info from APK without full decompilation.
 
         Extracts file size, resource counts, and detects common embedded libraries
-        by inspecting the APK's ZIP contents.
+        from the APK's ZIP entries in a single pass.
 
         Args:
             apk_path: Path to the APK file.
+            file_size: Size of the APK file in bytes.
+            entries: ZIP entries of the APK, as returned by _validate_apk.
 
         Returns:
             A dictionary containing file_size, file_name, resource_counts,
             and embedded_libraries.
         """
-        info = {
-            "file_size": apk_path.stat().st_size,
+        info: dict[str, Any] = {
+            "file_size": file_size,
             "file_name": apk_path.name,
         }
 
-        with zipfile.ZipFile(apk_path, "r") as zf:
+        dex_files = assets = resources = native_libs = 0
+        found_libraries: set[str] = set()
+
+        for entry in entries:
+            name = entry.filename
+
             # Count resources
-            info["resource_counts"] = {
-                "dex_files": len([n for n in zf.namelist() if n.endswith(".dex")]),
-                "assets": len([n for n in zf.namelist() if n.startswith("assets/")]),
-                "resources": len([n for n in zf.namelist() if n.startswith("res/")]),
-                "native_libs": len([n for n in zf.namelist() if n.startswith("lib/") and n.endswith(".so")]),
-            }
+            if name.endswith(".dex"):
+                dex_files += 1
+            if name.startswith("assets/"):
+                assets += 1
+            elif name.startswith("res/"):
+                resources += 1
+            elif name.startswith("lib/") and name.endswith(".so"):
+                native_libs += 1
 
             # Detect embedded libraries
-            info["embedded_libraries"] = []
-            if any("kotlin" in n.lower() for n in zf.namelist()):
-                info["embedded_libraries"].append("kotlin")
-            if any("okhttp" in n.lower() for n in zf.namelist()):
-                info["embedded_libraries"].append("okhttp")
-            if any("retrofit" in n.lower() for n in zf.namelist()):
-                info["embedded_libraries"].append("retrofit")
-            if any("rxjava" in n.lower() or "rxandroid" in n.lower() for n in zf.namelist()):
-                info["embedded_libraries"].append("rxjava")
+            for marker in self._LIBRARY_MARKER_REGEX.findall(name):
+                found_libraries.add(self._LIBRARY_MARKERS[marker.lower()])
+
+        info["resource_counts"] = {
+            "dex_files": dex_files,
+            "assets": assets,
+            "resources": resources,
+            "native_libs": native_libs,
+        }
+        info["embedded_libraries"] = [
+            lib for lib in dict.fromkeys(self._LIBRARY_MARKERS.values()) if lib in found_libraries
+        ]
 
         return info
 
@@ -186,7 +240,8 @@ class IngestionService:
             logger.info("Starting APK ingestion", apk_path=str(input_data.apk_path))
 
             # Validate APK
-            self._validate_apk(input_data.apk_path)
+            apk_entries = self._validate_apk(input_data.apk_path)
+            file_size = input_data.apk_path.stat().st_size
 
             # Compute hashes
             sha256, sha1, md5 = self._compute_file_hashes(input_data.apk_path)
@@ -197,47 +252,55 @@ class IngestionService:
                 sha256_hash=sha256,
                 sha1_hash=sha1,
                 md5_hash=md5,
-                file_size_bytes=input_data.apk_path.stat().st_size,
+                file_size_bytes=file_size,
                 file_name=input_data.apk_path.name,
                 acquired_at=datetime.utcnow(),
                 play_store_url=input_data.play_store_url,
             )
 
             # Extract basic info
-            basic_info = self._extract_basic_info(input_data.apk_path)
+            basic_info = self._extract_basic_info(input_data.apk_path, file_size, apk_entries)
 
             # Create placeholder manifest (will be filled by static analysis)
             manifest = ManifestData(
                 package_name=f"unknown.{sha256[:8]}",  # Placeholder
             )
 
-            # Create metadata object
-            metadata = APKMetadata(
+            # Create metadata object. Every field is either an already
+            # validated model or built by _extract_basic_info, so skip
+            # re-validating them.
+            metadata = APKMetadata.model_construct(
                 provenance=provenance,
                 manifest=manifest,
                 play_store=PlayStoreMetadata() if input_data.play_store_url else None,
                 analysis_timestamp=datetime.utcnow(),
-                embedded_libraries=basic_info.get("embedded_libraries", []),
-                resource_counts=basic_info.get("resource_counts", {}),
+                embedded_libraries=basic_info["embedded_libraries"],
+                resource_counts=basic_info["resource_counts"],
             )
 
             # Store APK
             apk_key = f"apks/{sha256}/{input_data.apk_path.name}"
-            with open(input_data.apk_path, "rb") as f:
-                await self.storage.store_bytes(apk_key, f.read(), {"provenance": provenance.model_dump()})
+            # The APK was just hashed, so the backend needn't read it again to
+            # hash it; the copy itself runs hot in the page cache
+            await self.storage.store_file(
+                apk_key, input_data.apk_path, {"provenance": provenance.model_dump()}, sha256=sha256
+            )
 
             # Store metadata
             metadata_key = f"apks/{sha256}/metadata.json"
             await self.storage.store_model(metadata_key, metadata)
 
-            # Store screenshots
-            screenshot_keys = []
-            for i, screenshot_path in enumerate(input_data.screenshots):
-                if screenshot_path.exists():
-                    key = f"apks/{sha256}/screenshots/{i:03d}_{screenshot_path.name}"
-                    with open(screenshot_path, "rb") as f:
-                        await self.storage.store_bytes(key, f.read())
-                    screenshot_keys.append(key)
+            # Store screenshots; they're independent, so copy them concurrently
+            screenshots = [
+                (f"apks/{sha256}/screenshots/{i:03d}_{screenshot_path.name}", screenshot_path)
+                for i, screenshot_path in enumerate(input_data.screenshots)
+                if screenshot_path.exists()
+            ]
+            screenshot_keys = list(
+                await asyncio.gather(
+                    *(self.storage.store_file(key, path) for key, path in screenshots)
+                )
+            )
 
             output = IngestionOutput(
                 apk_metadata=metadata,
@@ -262,6 +325,7 @@ class IngestionService:
                 message=f"Ingestion failed: {e}",
                 service_name="ingestion",
                 operation="ingest",
+                retryable=isinstance(e, RETRYABLE_EXCEPTIONS),
                 cause=e,
             )
 
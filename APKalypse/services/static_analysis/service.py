@@ -18,7 +18,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from ...core.config import get_config
-from ...core.exceptions import ServiceError, ToolNotFoundError
+from ...core.exceptions import RETRYABLE_EXCEPTIONS, ServiceError, ToolNotFoundError
 from ...core.logging import get_logger
 from ...core.types import ServiceResult
 from ...models.apk import (
@@ -205,12 +205,15 @@ class StaticAnalysisService:
         """
         import zipfile
 
-        output_dir.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(apk_path, "r") as zf:
-            # Only extract what we need
-            for name in zf.namelist():
-                if name.startswith("res/") or name == "AndroidManifest.xml":
-                    zf.extract(name, output_dir)
+        def extract() -> None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with zipfile.ZipFile(apk_path, "r") as zf:
+                # Only extract what we need
+                for name in zf.namelist():
+                    if name.startswith("res/") or name == "AndroidManifest.xml":
+                        zf.extract(name, output_dir)
+
+        await asyncio.to_thread(extract)
 
     def _parse_manifest(self, manifest_path: Path) -> ManifestData:
         """Parse AndroidManifest.xml into structured data.
@@ -461,6 +464,27 @@ class StaticAnalysisService:
 
         return frameworks
 
+    def _parse_decompiled(
+        self, work_dir: Path
+    ) -> tuple[ManifestData, list[UILayoutInfo], dict[str, str], list[str]]:
+        """Parse everything static analysis needs from a decompiled APK.
+
+        Args:
+            work_dir: Directory containing the decompiled APK.
+
+        Returns:
+            Tuple of (manifest, layouts, strings, detected frameworks).
+        """
+        manifest = self._parse_manifest(work_dir / "AndroidManifest.xml")
+
+        res_dir = work_dir / "res"
+        layouts = self._parse_layouts(res_dir) if res_dir.exists() else []
+        strings = self._parse_strings(res_dir) if res_dir.exists() else {}
+
+        detected_frameworks = self._detect_frameworks(work_dir)
+
+        return manifest, layouts, strings, detected_frameworks
+
     async def analyze(self, input_data: StaticAnalysisInput) -> ServiceResult[StaticAnalysisOutput]:
         """Perform static analysis on an APK.
 
@@ -499,19 +523,11 @@ class StaticAnalysisService:
             # Decompile APK (resources only)
             await self._decompile_apk(local_path, work_dir)
 
-            # Parse manifest
-            manifest_path = work_dir / "AndroidManifest.xml"
-            manifest = self._parse_manifest(manifest_path)
-
-            # Parse layouts
-            res_dir = work_dir / "res"
-            layouts = self._parse_layouts(res_dir) if res_dir.exists() else []
-
-            # Parse strings
-            strings = self._parse_strings(res_dir) if res_dir.exists() else {}
-
-            # Detect frameworks
-            detected_frameworks = self._detect_frameworks(work_dir)
+            # XML parsing and the framework scan are synchronous; run them off
+            # the event loop so concurrent tasks on this worker keep moving
+            manifest, layouts, strings, detected_frameworks = await asyncio.to_thread(
+                self._parse_decompiled, work_dir
+            )
 
             # Clean up decompiled files (compliance requirement)
             if self.config.compliance.purge_decompiled_after_analysis:
@@ -541,6 +557,7 @@ class StaticAnalysisService:
                 message=f"Static analysis failed: {e}",
                 service_name="static_analysis",
                 operation="analyze",
+                retryable=isinstance(e, RETRYABLE_EXCEPTIONS),
                 cause=e,
             )
 
@@ -2,5 +2,6 @@
 
 from .interface import StorageBackend
 from .local import LocalStorageBackend
+from .memory import InMemoryStorageBackend
 
-__all__ = ["StorageBackend", "LocalStorageBackend"]
+__all__ = ["StorageBackend", "LocalStorageBackend", "InMemoryStorageBackend"]
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import hashlib
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any, TypeVar
 
@@ -21,27 +22,70 @@ class StorageBackend(ABC):
     """Abstract storage backend interface."""
 
     @abstractmethod
-    async def store_bytes(self, key: str, data: bytes, metadata: dict[str, Any] | None = None) -> str:
+    async def store_bytes(
+        self,
+        key: str,
+        data: bytes,
+        metadata: dict[str, Any] | None = None,
+        *,
+        skip_metadata: bool = False,
+    ) -> str:
         """Store raw bytes and return the storage key.
 
         Args:
             key: Storage key/path
             data: Raw bytes to store
             metadata: Optional metadata to associate
+            skip_metadata: Don't record metadata, for artifacts whose
+                metadata is never read
 
         Returns:
             The final storage key
         """
         ...
 
+    async def store_file(
+        self,
+        key: str,
+        src_path: Path,
+        metadata: dict[str, Any] | None = None,
+        *,
+        sha256: str | None = None,
+    ) -> str:
+        """Store the contents of a local file and return the storage key.
+
+        The default implementation reads the file into memory and delegates to
+        store_bytes. Backends that can copy files directly should override it.
+
+        Args:
+            key: Storage key/path.
+            src_path: Path of the local file to store.
+            metadata: Optional metadata to associate.
+            sha256: SHA-256 hex digest of the file, if the caller already has
+                it, so backends can skip hashing the file again.
+
+        Returns:
+            The final storage key.
+        """
+        return await self.store_bytes(key, src_path.read_bytes(), metadata)
+
     @abstractmethod
-    async def store_text(self, key: str, content: str, metadata: dict[str, Any] | None = None) -> str:
+    async def store_text(
+        self,
+        key: str,
+        content: str,
+        metadata: dict[str, Any] | None = None,
+        *,
+        skip_metadata: bool = False,
+    ) -> str:
         """Store text content and return the storage key.
 
         Args:
             key: Storage key/path.
             content: Text content to store.
             metadata: Optional metadata to associate.
+            skip_metadata: Don't record metadata, for artifacts whose
+                metadata is never read.
 
         Returns:
             The final storage key.
@@ -135,6 +179,25 @@ class StorageBackend(ABC):
         """
         ...
 
+    async def iter_text(
+        self, prefix: str, suffix: str | tuple[str, ...] = ""
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Iterate over text content stored under a prefix.
+
+        Keys are loaded one at a time so callers can scan large artifact
+        trees without holding every file in memory.
+
+        Args:
+            prefix: Prefix to filter keys by.
+            suffix: Optional key suffix (or tuple of suffixes) to filter by.
+
+        Yields:
+            Tuples of (key, text content) in sorted key order.
+        """
+        for key in await self.list_keys(prefix):
+            if key.endswith(suffix):
+                yield key, await self.load_text(key)
+
     @abstractmethod
     async def get_metadata(self, key: str) -> dict[str, Any]:
         """Get metadata for a key.
@@ -7,7 +7,10 @@ suitable for development and single-machine deployments.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any, TypeVar
@@ -99,16 +102,25 @@ class LocalStorageBackend(StorageBackend):
         metadata["_stored_at"] = datetime.utcnow().isoformat()
         metadata["_key"] = key
         
-        async with aiofiles.open(meta_path, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(metadata, indent=2, default=str))
-
-    async def store_bytes(self, key: str, data: bytes, metadata: dict[str, Any] | None = None) -> str:
+        await asyncio.to_thread(
+            meta_path.write_text, json.dumps(metadata, indent=2, default=str), encoding="utf-8"
+        )
+
+    async def store_bytes(
+        self,
+        key: str,
+        data: bytes,
+        metadata: dict[str, Any] | None = None,
+        *,
+        skip_metadata: bool = False,
+    ) -> str:
         """Store raw bytes to filesystem.
 
         Args:
             key: The storage key under which to store the data.
             data: The raw bytes to store.
             metadata: Optional metadata to associate with the stored data.
+            skip_metadata: If True, don't write the metadata sidecar file.
 
         Returns:
             The storage key where the data was stored.
@@ -116,8 +128,12 @@ class LocalStorageBackend(StorageBackend):
         full_path = self._get_full_path(key)
         await self._ensure_parent(full_path)
         
-        async with aiofiles.open(full_path, "wb") as f:
-            await f.write(data)
+        # One worker-thread hop for open+write+close; aiofiles would take
+        # a separate hop for each of them
+        await asyncio.to_thread(full_path.write_bytes, data)
+        
+        if skip_metadata:
+            return key
         
         # Store metadata
         meta = metadata or {}
@@ -127,13 +143,78 @@ class LocalStorageBackend(StorageBackend):
         
         return key
 
-    async def store_text(self, key: str, content: str, metadata: dict[str, Any] | None = None) -> str:
+    async def store_file(
+        self,
+        key: str,
+        src_path: Path,
+        metadata: dict[str, Any] | None = None,
+        *,
+        sha256: str | None = None,
+    ) -> str:
+        """Copy a local file into the filesystem store.
+
+        The copy runs in a worker thread via shutil.copyfile, which uses
+        kernel-side copying where available, so the file is never loaded
+        into memory as a whole.
+
+        Args:
+            key: The storage key under which to store the file.
+            src_path: Path of the local file to copy.
+            metadata: Optional metadata to associate with the stored file.
+            sha256: Known SHA-256 hex digest of the file. When given, the
+                stored copy is not read back to hash it.
+
+        Returns:
+            The storage key where the file was stored.
+        """
+        full_path = self._get_full_path(key)
+        await self._ensure_parent(full_path)
+
+        await asyncio.to_thread(shutil.copyfile, src_path, full_path)
+
+        # Store metadata
+        meta = metadata or {}
+        meta["size_bytes"] = full_path.stat().st_size
+        meta["hash"] = sha256 or await asyncio.to_thread(self._compute_file_hash, full_path)
+        await self._store_metadata(key, meta)
+
+        return key
+
+    @staticmethod
+    def _compute_file_hash(path: Path) -> str:
+        """Compute the SHA-256 hash of a file without reading it whole.
+
+        Args:
+            path: The file to hash.
+
+        Returns:
+            Hexadecimal string representation of the SHA-256 hash.
+        """
+        digest = hashlib.sha256()
+        # Read into one reused 1 MiB buffer rather than allocating a new
+        # bytes object per chunk
+        buffer = bytearray(1024 * 1024)
+        view = memoryview(buffer)
+        with open(path, "rb", buffering=0) as f:
+            while n := f.readinto(buffer):
+                digest.update(view[:n])
+        return digest.hexdigest()
+
+    async def store_text(
+        self,
+        key: str,
+        content: str,
+        metadata: dict[str, Any] | None = None,
+        *,
+        skip_metadata: bool = False,
+    ) -> str:
         """Store text content to filesystem.
 
         Args:
             key: The storage key under which to store the content.
             content: The text content to store.
             metadata: Optional metadata to associate with the stored content.
+            skip_metadata: If True, don't write the metadata sidecar file.
 
         Returns:
             The storage key where the content was stored.
@@ -141,8 +222,10 @@ class LocalStorageBackend(StorageBackend):
         full_path = self._get_full_path(key)
         await self._ensure_parent(full_path)
         
-        async with aiofiles.open(full_path, "w", encoding="utf-8") as f:
-            await f.write(content)
+        await asyncio.to_thread(full_path.write_text, content, encoding="utf-8")
+        
+        if skip_metadata:
+            return key
         
         # Store metadata
         meta = metadata or {}
@@ -163,12 +246,14 @@ class LocalStorageBackend(StorageBackend):
         Returns:
             The storage key where the model was stored.
         """
-        json_content = model.model_dump_json(indent=2)
+        # Serialize straight to UTF-8 bytes (what model_dump_json decodes from)
+        # so the JSON isn't decoded to str only to be re-encoded for the write
+        json_bytes = model.__pydantic_serializer__.to_json(model, indent=2)
         
         meta = metadata or {}
         meta["model_type"] = type(model).__name__
         
-        return await self.store_text(key, json_content, meta)
+        return await self.store_bytes(key, json_bytes, meta)
 
     async def load_bytes(self, key: str) -> bytes:
         """Load raw bytes from filesystem.
@@ -223,8 +308,8 @@ class LocalStorageBackend(StorageBackend):
         Raises:
             FileNotFoundError: If the key does not exist.
         """
-        json_content = await self.load_text(key)
-        return model_type.model_validate_json(json_content)
+        json_bytes = await self.load_bytes(key)
+        return model_type.model_validate_json(json_bytes)
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in filesystem.
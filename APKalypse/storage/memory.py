@@ -0,0 +1,234 @@
+"""
+In-memory storage backend.
+
+Provides a dictionary-backed implementation of the storage interface,
+suitable for tests and short-lived runs that don't need persistence.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from .interface import StorageBackend
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class InMemoryStorageBackend(StorageBackend):
+    """In-memory storage backend."""
+
+    def __init__(self) -> None:
+        """Initialize empty in-memory storage."""
+        self._data: dict[str, bytes] = {}
+        self._metadata: dict[str, dict[str, Any]] = {}
+
+    def _store_metadata(self, key: str, metadata: dict[str, Any]) -> None:
+        """Store metadata for a key.
+
+        Adds the same standard metadata fields (_stored_at, _key) as the
+        local backend.
+
+        Args:
+            key: The storage key to associate metadata with.
+            metadata: Dictionary of metadata to store.
+        """
+        metadata["_stored_at"] = datetime.utcnow().isoformat()
+        metadata["_key"] = key
+        self._metadata[key] = metadata
+
+    async def store_bytes(
+        self,
+        key: str,
+        data: bytes,
+        metadata: dict[str, Any] | None = None,
+        *,
+        skip_metadata: bool = False,
+    ) -> str:
+        """Store raw bytes in memory.
+
+        Args:
+            key: The storage key under which to store the data.
+            data: The raw bytes to store.
+            metadata: Optional metadata to associate with the stored data.
+            skip_metadata: If True, don't record metadata for the key.
+
+        Returns:
+            The storage key where the data was stored.
+        """
+        self._data[key] = data
+
+        if skip_metadata:
+            return key
+
+        meta = metadata or {}
+        meta["size_bytes"] = len(data)
+        meta["hash"] = self.compute_hash(data)
+        self._store_metadata(key, meta)
+
+        return key
+
+    async def store_text(
+        self,
+        key: str,
+        content: str,
+        metadata: dict[str, Any] | None = None,
+        *,
+        skip_metadata: bool = False,
+    ) -> str:
+        """Store text content in memory as UTF-8 bytes.
+
+        Args:
+            key: The storage key under which to store the content.
+            content: The text content to store.
+            metadata: Optional metadata to associate with the stored content.
+            skip_metadata: If True, don't record metadata for the key.
+
+        Returns:
+            The storage key where the content was stored.
+        """
+        data = content.encode("utf-8")
+        self._data[key] = data
+
+        if skip_metadata:
+            return key
+
+        meta = metadata or {}
+        meta["size_chars"] = len(content)
+        meta["hash"] = self.compute_hash(data)
+        self._store_metadata(key, meta)
+
+        return key
+
+    async def store_model(self, key: str, model: BaseModel, metadata: dict[str, Any] | None = None) -> str:
+        """Store Pydantic model as JSON.
+
+        Args:
+            key: The storage key under which to store the model.
+            model: The Pydantic model instance to serialize and store.
+            metadata: Optional metadata to associate with the stored model.
+
+        Returns:
+            The storage key where the model was stored.
+        """
+        json_bytes = model.__pydantic_serializer__.to_json(model, indent=2)
+
+        meta = metadata or {}
+        meta["model_type"] = type(model).__name__
+
+        return await self.store_bytes(key, json_bytes, meta)
+
+    async def load_bytes(self, key: str) -> bytes:
+        """Load raw bytes from memory.
+
+        Args:
+            key: The storage key to load data from.
+
+        Returns:
+            The raw bytes stored at the given key.
+
+        Raises:
+            FileNotFoundError: If the key does not exist.
+        """
+        try:
+            return self._data[key]
+        except KeyError:
+            raise FileNotFoundError(f"Key not found: {key}") from None
+
+    async def load_text(self, key: str) -> str:
+        """Load text content from memory.
+
+        Args:
+            key: The storage key to load content from.
+
+        Returns:
+            The text content stored at the given key.
+
+        Raises:
+            FileNotFoundError: If the key does not exist.
+        """
+        return (await self.load_bytes(key)).decode("utf-8")
+
+    async def load_model(self, key: str, model_type: type[T]) -> T:
+        """Load Pydantic model from stored JSON.
+
+        Args:
+            key: The storage key to load the model from.
+            model_type: The Pydantic model class to deserialize into.
+
+        Returns:
+            An instance of the specified model type populated with stored data.
+
+        Raises:
+            FileNotFoundError: If the key does not exist.
+        """
+        return model_type.model_validate_json(await self.load_bytes(key))
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in memory.
+
+        Args:
+            key: The storage key to check.
+
+        Returns:
+            True if the key exists, False otherwise.
+        """
+        return key in self._data
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key and its metadata from memory.
+
+        Args:
+            key: The storage key to delete.
+
+        Returns:
+            True if the key was deleted, False if it did not exist.
+        """
+        self._metadata.pop(key, None)
+        return self._data.pop(key, None) is not None
+
+    async def list_keys(self, prefix: str = "") -> list[str]:
+        """List all keys with prefix.
+
+        As with the local backend, the prefix is treated as a directory,
+        so "dir1" matches "dir1/file.txt" but not "dir10/file.txt".
+
+        Args:
+            prefix: Optional prefix to filter keys. If empty, lists all keys.
+
+        Returns:
+            A sorted list of storage keys matching the prefix.
+        """
+        prefix = prefix.strip("/")
+        if not prefix:
+            return sorted(self._data)
+
+        dir_prefix = prefix + "/"
+        return sorted(key for key in self._data if key.startswith(dir_prefix))
+
+    async def get_metadata(self, key: str) -> dict[str, Any]:
+        """Get metadata for a key.
+
+        Args:
+            key: The storage key to retrieve metadata for.
+
+        Returns:
+            A dictionary of metadata, or an empty dict if no metadata exists.
+        """
+        return self._metadata.get(key, {})
+
+    def get_local_path(self, key: str) -> Path | None:
+        """Get local filesystem path for a key.
+
+        In-memory content has no filesystem location.
+
+        Args:
+            key: The storage key to get the path for.
+
+        Returns:
+            Always None.
+        """
+        return None
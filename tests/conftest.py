@@ -1,20 +1,21 @@
 """Test configuration for APKalypse."""
 
 import pytest
-import asyncio
-from pathlib import Path
-import tempfile
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for tests.
 
-    Yields:
+    Built on pytest's ``tmp_path`` so every test, including tests running
+    on different pytest-xdist workers, gets its own directory.
+
+    Args:
+        tmp_path: Pytest fixture providing a unique per-test directory.
+
+    Returns:
         Path: A Path object pointing to the temporary directory.
-            The directory is automatically cleaned up after the test.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 @pytest.fixture
 def sample_apk_bytes():
@@ -53,30 +54,179 @@ def sample_apk(temp_dir, sample_apk_bytes):
     return apk_path
 
 @pytest.fixture
-def storage(temp_dir):
+def storage(request):
     """Create a storage backend for testing.
 
+    Tests get in-memory storage unless they are marked ``integration``,
+    in which case they exercise the filesystem backend end-to-end.
+
     Args:
-        temp_dir: Pytest fixture providing a temporary directory path.
+        request: Pytest fixture providing the requesting test's context.
+
+    Returns:
+        StorageBackend: An InMemoryStorageBackend, or for integration tests
+            a LocalStorageBackend configured to use a temporary directory.
+    """
+    from src.storage import InMemoryStorageBackend, LocalStorageBackend
+    if "integration" in request.keywords:
+        return LocalStorageBackend(request.getfixturevalue("temp_dir"))
+    return InMemoryStorageBackend()
+
+@pytest.fixture(scope="session")
+def prompt_template():
+    """Create a prompt template shared across tests.
+
+    Templates are only read by the tests, so a single instance is built
+    for the whole session.
+
+    Returns:
+        PromptTemplate: A template with a system prompt and a user prompt
+            taking an ``input`` variable.
+    """
+    from src.agents.base import PromptTemplate
+    return PromptTemplate(
+        template_id="test",
+        version="1.0.0",
+        system_prompt="You are a helpful assistant.",
+        user_prompt_template="Process: {input}",
+    )
+
+@pytest.fixture(scope="session")
+def behavioral_observer_agent():
+    """Create a behavioral observer agent shared across tests.
+
+    The tests only call read-only agent methods, so one agent is built
+    for the whole session.
 
     Returns:
-        LocalStorageBackend: A local storage backend instance configured
-            to use the temporary directory.
+        BehavioralObserverAgent: An agent using the default configuration.
     """
-    from src.storage import LocalStorageBackend
-    return LocalStorageBackend(temp_dir)
+    from src.agents.behavioral_observer import BehavioralObserverAgent
+    return BehavioralObserverAgent()
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests.
+def product_spec_author_agent():
+    """Create a product spec author agent shared across tests.
 
-    Creates a new event loop for the test session. This fixture is scoped
-    to the session level, meaning the same loop is reused for all async tests.
+    The tests only call read-only agent methods, so one agent is built
+    for the whole session.
 
-    Yields:
-        asyncio.AbstractEventLoop: The event loop instance for running
-            async tests. The loop is closed after the session ends.
+    Returns:
+        ProductSpecAuthorAgent: An agent using the default configuration.
+    """
+    from src.agents.product_spec import ProductSpecAuthorAgent
+    return ProductSpecAuthorAgent()
+
+@pytest.fixture(scope="module")
+def sample_manifest():
+    """Create a manifest shared by the tests of a module.
+
+    Tests only read from it, so it is validated once per module.
+
+    Returns:
+        ManifestData: A manifest with one launcher activity among three
+            activities, and two dangerous permissions among three.
+    """
+    from src.models.apk import ActivityInfo, ManifestData, PermissionCategory, PermissionInfo
+    return ManifestData(
+        package_name="com.example.app",
+        activities=[
+            ActivityInfo(name="com.example.app.SplashActivity", is_launcher=False),
+            ActivityInfo(name="com.example.app.MainActivity", is_launcher=True),
+            ActivityInfo(name="com.example.app.SettingsActivity", is_launcher=False),
+        ],
+        permissions=[
+            PermissionInfo(name="android.permission.INTERNET", category=PermissionCategory.NORMAL),
+            PermissionInfo(name="android.permission.CAMERA", category=PermissionCategory.DANGEROUS),
+            PermissionInfo(name="android.permission.LOCATION", category=PermissionCategory.DANGEROUS),
+        ],
+    )
+
+@pytest.fixture(scope="module")
+def sample_behavior_model():
+    """Create a behavior model shared by the tests of a module.
+
+    Tests that only query the model use it as-is; tests that mutate it
+    must work on a ``model_copy(deep=True)``.
+
+    Returns:
+        BehaviorModel: A model with two screens, one transition from
+            s1 to s2, and one user intent.
+    """
+    from src.models.behavior import (
+        ActionType,
+        BehaviorModel,
+        ScreenModel,
+        StateTransition,
+        UserAction,
+        UserIntent,
+    )
+    return BehaviorModel(
+        model_id="model_1",
+        app_package="com.example.app",
+        screens=[
+            ScreenModel(screen_id="s1", screen_name="Screen 1"),
+            ScreenModel(screen_id="s2", screen_name="Screen 2"),
+        ],
+        transitions=[
+            StateTransition(
+                transition_id="t1",
+                from_screen_id="s1",
+                to_screen_id="s2",
+                triggered_by_action=UserAction(
+                    action_id="a1",
+                    action_type=ActionType.TAP,
+                    source_screen_id="s1",
+                ),
+            ),
+        ],
+        user_intents=[
+            UserIntent(
+                intent_id="i1",
+                name="Login",
+                description="User login",
+            ),
+        ],
+    )
+
+@pytest.fixture(scope="module")
+def observer_input():
+    """Create a behavioral observer input shared by the tests of a module.
+
+    prepare_input only reads from it, so it is validated once per module.
+
+    Returns:
+        BehavioralObserverInput: Input for a login screen reached from the
+            Home and Welcome screens.
+    """
+    from src.agents.behavioral_observer import BehavioralObserverInput
+    return BehavioralObserverInput(
+        screen_hierarchy="<root><button/></root>",
+        screen_screenshot_description="A login screen",
+        current_activity="com.example.LoginActivity",
+        previous_screens=["Home", "Welcome"],
+        observed_actions=["tap_login", "type_email"],
+    )
+
+@pytest.fixture(scope="module")
+def low_confidence_observer_output():
+    """Create a low-confidence observer output shared by the tests of a module.
+
+    validate_output only reads from it, so it is validated once per module.
+
+    Returns:
+        BehavioralObserverOutput: An output with a confidence of 0.3 and
+            an observation with no primary elements.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    from src.agents.behavioral_observer import BehavioralObserverOutput, ScreenObservation
+    return BehavioralObserverOutput(
+        observation=ScreenObservation(
+            screen_name="Test",
+            screen_purpose="Testing",
+            primary_elements=[],
+            possible_actions=[],
+            navigation_options=[],
+            data_displayed=[],
+        ),
+        confidence=0.3,
+    )
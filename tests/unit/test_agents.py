@@ -5,46 +5,36 @@ from unittest.mock import AsyncMock, patch, MagicMock
 
 from src.agents.base import Agent, AgentContext, AgentResponse, PromptTemplate
 from src.agents.behavioral_observer import (
-    BehavioralObserverAgent,
     BehavioralObserverInput,
     BehavioralObserverOutput,
 )
-from src.agents.product_spec import (
-    ProductSpecAuthorAgent,
-    ProductSpecInput,
-)
+from src.agents.product_spec import ProductSpecInput
 
 
 class TestPromptTemplate:
     """Tests for prompt templates."""
 
-    def test_render_system(self):
+    def test_render_system(self, prompt_template):
         """Test system prompt rendering.
 
         Verifies that the system prompt is rendered correctly without
         any template substitutions.
+
+        Args:
+            prompt_template: Pytest fixture providing a shared prompt template.
         """
-        template = PromptTemplate(
-            template_id="test",
-            version="1.0.0",
-            system_prompt="You are a helpful assistant.",
-            user_prompt_template="Process: {input}",
-        )
-        assert template.render_system() == "You are a helpful assistant."
+        assert prompt_template.render_system() == "You are a helpful assistant."
 
-    def test_render_user(self):
+    def test_render_user(self, prompt_template):
         """Test user prompt rendering.
 
         Verifies that template variables are correctly substituted
         in the user prompt.
+
+        Args:
+            prompt_template: Pytest fixture providing a shared prompt template.
         """
-        template = PromptTemplate(
-            template_id="test",
-            version="1.0.0",
-            system_prompt="System",
-            user_prompt_template="Process: {input}",
-        )
-        rendered = template.render_user(input="test data")
+        rendered = prompt_template.render_user(input="test data")
         assert "test data" in rendered
 
     def test_render_user_with_format_instructions(self):
@@ -63,20 +53,17 @@ class TestPromptTemplate:
         rendered = template.render_user(input="test")
         assert "Return JSON." in rendered
 
-    def test_get_hash(self):
+    def test_get_hash(self, prompt_template):
         """Test deterministic hash generation.
 
         Verifies that the template hash is consistent across multiple
         calls and has the expected length.
+
+        Args:
+            prompt_template: Pytest fixture providing a shared prompt template.
         """
-        template = PromptTemplate(
-            template_id="test",
-            version="1.0.0",
-            system_prompt="System",
-            user_prompt_template="User {var}",
-        )
-        hash1 = template.get_hash()
-        hash2 = template.get_hash()
+        hash1 = prompt_template.get_hash()
+        hash2 = prompt_template.get_hash()
         assert hash1 == hash2
         assert len(hash1) == 16
 
@@ -84,83 +71,99 @@ class TestPromptTemplate:
 class TestBehavioralObserverAgent:
     """Tests for the behavioral observer agent."""
 
-    def test_agent_properties(self):
+    def test_agent_properties(self, behavioral_observer_agent):
         """Test agent property accessors.
 
         Verifies that the agent exposes the correct name, input type,
         and output type properties.
+
+        Args:
+            behavioral_observer_agent: Pytest fixture providing a shared agent.
         """
-        agent = BehavioralObserverAgent()
+        agent = behavioral_observer_agent
         assert agent.name == "behavioral_observer"
         assert agent.input_type == BehavioralObserverInput
         assert agent.output_type == BehavioralObserverOutput
 
-    def test_prepare_input(self):
+    def test_prompt_template_reused(self, behavioral_observer_agent):
+        """Test prompt template reuse.
+
+        Verifies that the agent builds its prompt template once and that
+        the shared template hashes like a freshly built one.
+
+        Args:
+            behavioral_observer_agent: Pytest fixture providing a shared agent.
+        """
+        agent = behavioral_observer_agent
+        assert agent.prompt_template is agent.prompt_template
+        assert agent.prompt_template.get_hash() == agent.get_prompt_template().get_hash()
+
+    def test_prepare_input(self, behavioral_observer_agent, observer_input):
         """Test input preparation.
 
         Verifies that the agent correctly transforms structured input
         into a dictionary suitable for prompt template rendering.
+
+        Args:
+            behavioral_observer_agent: Pytest fixture providing a shared agent.
+            observer_input: Pytest fixture providing a shared observer input.
         """
-        agent = BehavioralObserverAgent()
-        input_data = BehavioralObserverInput(
-            screen_hierarchy="<root><button/></root>",
-            screen_screenshot_description="A login screen",
-            current_activity="com.example.LoginActivity",
-            previous_screens=["Home", "Welcome"],
-            observed_actions=["tap_login", "type_email"],
-        )
-        prepared = agent.prepare_input(input_data)
+        prepared = behavioral_observer_agent.prepare_input(observer_input)
         
-        assert "screen_hierarchy" in prepared
-        assert "screen_screenshot_description" in prepared
-        assert "current_activity" in prepared
-        assert "Home, Welcome" in prepared["previous_screens"]
-
-    def test_validate_output_low_confidence(self):
+        assert prepared == {
+            "screen_hierarchy": "<root><button/></root>",
+            "screen_screenshot_description": "A login screen",
+            "current_activity": "com.example.LoginActivity",
+            "previous_screens": "Home, Welcome",
+            "observed_actions": "tap_login, type_email",
+        }
+
+    def test_validate_output_low_confidence(
+        self, behavioral_observer_agent, low_confidence_observer_output
+    ):
         """Test output validation with low confidence.
 
         Verifies that the agent generates warnings when the output
         confidence score falls below the acceptable threshold.
+
+        Args:
+            behavioral_observer_agent: Pytest fixture providing a shared agent.
+            low_confidence_observer_output: Pytest fixture providing a shared
+                low-confidence output.
         """
-        agent = BehavioralObserverAgent()
-        from src.agents.behavioral_observer import ScreenObservation
-        
-        output = BehavioralObserverOutput(
-            observation=ScreenObservation(
-                screen_name="Test",
-                screen_purpose="Testing",
-                primary_elements=[],
-                possible_actions=[],
-                navigation_options=[],
-                data_displayed=[],
-            ),
-            confidence=0.3,
-        )
-        warnings = agent.validate_output(output)
-        assert len(warnings) > 0
-        assert any("confidence" in w.lower() for w in warnings)
+        warnings = behavioral_observer_agent.validate_output(low_confidence_observer_output)
+        assert warnings == [
+            "Low confidence observation: 0.3",
+            "No primary elements identified",
+        ]
 
 
 class TestProductSpecAuthorAgent:
     """Tests for the product spec author agent."""
 
-    def test_agent_properties(self):
+    def test_agent_properties(self, product_spec_author_agent):
         """Test agent property accessors.
 
         Verifies that the agent exposes the correct name and description
         indicating its implementation-agnostic nature.
+
+        Args:
+            product_spec_author_agent: Pytest fixture providing a shared agent.
         """
-        agent = ProductSpecAuthorAgent()
+        agent = product_spec_author_agent
         assert agent.name == "product_spec_author"
         assert "implementation-agnostic" in agent.description.lower()
 
-    def test_prepare_input(self):
+    def test_prepare_input(self, product_spec_author_agent):
         """Test input preparation.
 
         Verifies that the agent correctly transforms structured input
         including app metadata, screens, intents, and navigation flows.
+
+        Args:
+            product_spec_author_agent: Pytest fixture providing a shared agent.
         """
-        agent = ProductSpecAuthorAgent()
+        agent = product_spec_author_agent
         input_data = ProductSpecInput(
             app_name="Test App",
             app_description="A test application",
@@ -172,40 +175,40 @@ class TestProductSpecAuthorAgent:
         prepared = agent.prepare_input(input_data)
         
         assert prepared["app_name"] == "Test App"
-        assert "User, Product" in prepared["data_entities"]
+        assert prepared["data_entities"] == "User, Product"
 
 
 class TestAgentContext:
     """Tests for agent context."""
 
-    def test_context_creation(self):
-        """Test context creation.
+    @pytest.mark.parametrize(
+        "overrides,expected_temp,expected_max",
+        [
+            ({}, None, None),
+            ({"temperature_override": 0.5, "max_tokens_override": 4096}, 0.5, 4096),
+        ],
+    )
+    def test_context_creation(self, overrides, expected_temp, expected_max):
+        """Test context creation with and without overrides.
 
         Verifies that an AgentContext can be created with required
-        fields and that optional fields default to None.
+        fields, that overrides default to None, and that temperature
+        and max_tokens overrides are stored when provided.
+
+        Args:
+            overrides: Optional override fields passed to the context.
+            expected_temp: The expected temperature override.
+            expected_max: The expected max_tokens override.
         """
         context = AgentContext(
             run_id="run_123",
             stage="analysis",
+            **overrides,
         )
         assert context.run_id == "run_123"
         assert context.stage == "analysis"
-        assert context.temperature_override is None
-
-    def test_context_with_overrides(self):
-        """Test context with overrides.
-
-        Verifies that temperature and max_tokens overrides are correctly
-        stored in the context when provided.
-        """
-        context = AgentContext(
-            run_id="run_123",
-            stage="analysis",
-            temperature_override=0.5,
-            max_tokens_override=4096,
-        )
-        assert context.temperature_override == 0.5
-        assert context.max_tokens_override == 4096
+        assert context.temperature_override == expected_temp
+        assert context.max_tokens_override == expected_max
 
 
 class TestAgentResponse:
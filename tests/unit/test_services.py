@@ -4,7 +4,6 @@ import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
-from src.storage import LocalStorageBackend
 from src.services.ingestion import IngestionService
 from src.services.ingestion.service import IngestionInput
 from src.services.compliance import ComplianceGuard
@@ -15,14 +14,14 @@ from src.services.compliance.service import ComplianceInput
 class TestIngestionService:
     """Tests for the ingestion service."""
 
-    async def test_ingest_valid_apk(self, temp_dir, sample_apk):
+    @pytest.mark.integration
+    async def test_ingest_valid_apk(self, storage, sample_apk):
         """Test ingesting a valid APK.
 
         Args:
-            temp_dir: Temporary directory fixture for test isolation.
+            storage: Storage backend fixture (on-disk for this integration test).
             sample_apk: Sample APK file fixture for testing.
         """
-        storage = LocalStorageBackend(temp_dir)
         service = IngestionService(storage)
         
         input_data = IngestionInput(apk_path=sample_apk)
@@ -33,28 +32,50 @@ class TestIngestionService:
         assert result.data.apk_metadata.provenance.sha256_hash is not None
         assert result.data.normalized_apk_path is not None
 
-    async def test_ingest_nonexistent_file(self, temp_dir):
+    @pytest.mark.parametrize("file_name", ["app.apk", "app.txt"])
+    async def test_ingest_nonexistent_file(self, storage, file_name):
         """Test ingesting a non-existent file.
 
+        A missing file is reported as not found whether or not it has an
+        .apk extension.
+
         Args:
-            temp_dir: Temporary directory fixture for test isolation.
+            storage: Storage backend fixture.
+            file_name: Name of the missing file.
         """
-        storage = LocalStorageBackend(temp_dir)
         service = IngestionService(storage)
         
-        input_data = IngestionInput(apk_path=Path("/nonexistent/app.apk"))
+        input_data = IngestionInput(apk_path=Path("/nonexistent") / file_name)
         result = await service.ingest(input_data)
         
         assert not result.success
         assert "not found" in result.error.lower()
 
-    async def test_ingest_invalid_file(self, temp_dir):
+    async def test_ingest_non_apk_file(self, storage, temp_dir):
+        """Test ingesting an existing file without an .apk extension.
+
+        Args:
+            storage: Storage backend fixture.
+            temp_dir: Temporary directory fixture for test isolation.
+        """
+        service = IngestionService(storage)
+
+        other_file = temp_dir / "app.txt"
+        other_file.write_text("not an apk")
+
+        input_data = IngestionInput(apk_path=other_file)
+        result = await service.ingest(input_data)
+
+        assert not result.success
+        assert "not an apk" in result.error.lower()
+
+    async def test_ingest_invalid_file(self, storage, temp_dir):
         """Test ingesting an invalid file.
 
         Args:
+            storage: Storage backend fixture.
             temp_dir: Temporary directory fixture for test isolation.
         """
-        storage = LocalStorageBackend(temp_dir)
         service = IngestionService(storage)
         
         # Create a non-APK file
@@ -71,13 +92,12 @@ class TestIngestionService:
 class TestComplianceGuard:
     """Tests for the compliance guard service."""
 
-    async def test_check_clean_code(self, temp_dir):
+    async def test_check_clean_code(self, storage):
         """Test compliance check with clean code.
 
         Args:
-            temp_dir: Temporary directory fixture for test isolation.
+            storage: Storage backend fixture.
         """
-        storage = LocalStorageBackend(temp_dir)
         guard = ComplianceGuard(storage)
         
         input_data = ComplianceInput(
@@ -102,13 +122,12 @@ class TestComplianceGuard:
         assert result.success
         assert result.data.compliance_report.passed
 
-    async def test_check_suspicious_patterns(self, temp_dir):
+    async def test_check_suspicious_patterns(self, storage):
         """Test compliance check with suspicious patterns.
 
         Args:
-            temp_dir: Temporary directory fixture for test isolation.
+            storage: Storage backend fixture.
         """
-        storage = LocalStorageBackend(temp_dir)
         guard = ComplianceGuard(storage)
         
         input_data = ComplianceInput(
@@ -130,13 +149,36 @@ class TestComplianceGuard:
         report = result.data.compliance_report
         assert len(report.violations) > 0
 
-    async def test_calculate_similarity(self, temp_dir):
+    async def test_check_streams_generated_files_from_storage(self, storage):
+        """Test compliance check reading generated sources from storage.
+
+        Args:
+            storage: Storage backend fixture.
+        """
+        guard = ComplianceGuard(storage)
+
+        await storage.store_text("generated/run/App/app/src/Home.kt", "package com.example.app")
+        await storage.store_text("generated/run/App/build.gradle.kts", "plugins { }")
+
+        input_data = ComplianceInput(
+            run_id="test_run",
+            apk_hash="abc123" * 10,
+            generated_files_key="generated/run/App",
+        )
+
+        result = await guard.check(input_data)
+
+        assert result.success
+        report = result.data.compliance_report
+        assert report.artifacts_checked == 1
+        assert list(report.output_hashes) == ["app/src/Home.kt"]
+
+    async def test_calculate_similarity(self, storage):
         """Test code similarity calculation.
 
         Args:
-            temp_dir: Temporary directory fixture for test isolation.
+            storage: Storage backend fixture.
         """
-        storage = LocalStorageBackend(temp_dir)
         guard = ComplianceGuard(storage)
         
         # Identical code should have high similarity
@@ -163,13 +205,12 @@ class TestComplianceGuard:
         similarity = guard._calculate_similarity(code1, code3)
         assert similarity < 0.7
 
-    async def test_suspicious_pattern_detection(self, temp_dir):
+    async def test_suspicious_pattern_detection(self, storage):
         """Test suspicious pattern detection.
 
         Args:
-            temp_dir: Temporary directory fixture for test isolation.
+            storage: Storage backend fixture.
         """
-        storage = LocalStorageBackend(temp_dir)
         guard = ComplianceGuard(storage)
         
         clean_code = "fun hello() { }"
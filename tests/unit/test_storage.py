@@ -1,9 +1,11 @@
 """Unit tests for storage backend."""
 
+import asyncio
+
 import pytest
 from pathlib import Path
 
-from src.storage import LocalStorageBackend
+from src.storage import InMemoryStorageBackend, LocalStorageBackend
 from src.models.behavior import ScreenModel
 
 
@@ -11,67 +13,69 @@ from src.models.behavior import ScreenModel
 class TestLocalStorageBackend:
     """Tests for local filesystem storage."""
 
-    async def test_store_and_load_bytes(self, temp_dir):
-        """Test storing and loading bytes.
-
-        Verifies that binary data can be stored and retrieved correctly
-        from the local storage backend.
+    @pytest.mark.parametrize(
+        "kind,key,payload",
+        [
+            ("bytes", "test/data.bin", b"Hello, World!"),
+            ("text", "test/text.txt", "Hello, World!"),
+            (
+                "model",
+                "test/screen.json",
+                ScreenModel(
+                    screen_id="s1",
+                    screen_name="Test Screen",
+                    description="A test screen",
+                ),
+            ),
+        ],
+    )
+    async def test_store_and_load(self, temp_dir, kind, key, payload):
+        """Test storing and loading each supported payload kind.
+
+        Verifies that bytes, text, and Pydantic models round-trip through
+        the local storage backend unchanged.
 
         Args:
             temp_dir: Pytest fixture providing a temporary directory path.
+            kind: The payload kind, selecting the store/load method pair.
+            key: The storage key to use.
+            payload: The value to store.
         """
         storage = LocalStorageBackend(temp_dir)
         
-        data = b"Hello, World!"
-        key = "test/data.bin"
-        
-        stored_key = await storage.store_bytes(key, data)
+        stored_key = await getattr(storage, f"store_{kind}")(key, payload)
         assert stored_key == key
         
-        loaded = await storage.load_bytes(key)
-        assert loaded == data
-
-    async def test_store_and_load_text(self, temp_dir):
-        """Test storing and loading text.
-
-        Verifies that text content can be stored and retrieved correctly
-        from the local storage backend.
-
-        Args:
-            temp_dir: Pytest fixture providing a temporary directory path.
-        """
-        storage = LocalStorageBackend(temp_dir)
-        
-        content = "Hello, World!"
-        key = "test/text.txt"
-        
-        await storage.store_text(key, content)
-        loaded = await storage.load_text(key)
-        assert loaded == content
+        if kind == "model":
+            loaded = await storage.load_model(key, ScreenModel)
+        else:
+            loaded = await getattr(storage, f"load_{kind}")(key)
+        assert loaded == payload
 
-    async def test_store_and_load_model(self, temp_dir):
-        """Test storing and loading Pydantic models.
+    async def test_store_file(self, temp_dir):
+        """Test storing a local file.
 
-        Verifies that Pydantic models can be serialized to JSON, stored,
-        and deserialized back correctly.
+        Verifies that a file is copied into storage unchanged and that its
+        size and content hash are recorded in the metadata.
 
         Args:
             temp_dir: Pytest fixture providing a temporary directory path.
         """
-        storage = LocalStorageBackend(temp_dir)
+        storage = LocalStorageBackend(temp_dir / "store")
         
-        model = ScreenModel(
-            screen_id="s1",
-            screen_name="Test Screen",
-            description="A test screen",
-        )
-        key = "test/screen.json"
+        data = b"PK\x03\x04" + bytes(range(256)) * 64
+        src_path = temp_dir / "app.apk"
+        src_path.write_bytes(data)
+        key = "apks/abc/app.apk"
         
-        await storage.store_model(key, model)
-        loaded = await storage.load_model(key, ScreenModel)
+        stored_key = await storage.store_file(key, src_path, {"custom": "value"})
+        assert stored_key == key
+        assert await storage.load_bytes(key) == data
         
-        assert loaded.screen_id == model.screen_id
-        assert loaded.screen_name == model.screen_name
+        meta = await storage.get_metadata(key)
+        assert meta["custom"] == "value"
+        assert meta["size_bytes"] == len(data)
+        assert meta["hash"] == storage.compute_hash(data)
 
     async def test_exists(self, temp_dir):
         """Test checking if key exists.
@@ -103,7 +107,6 @@ class TestLocalStorageBackend:
         
         key = "test/delete.txt"
         await storage.store_text(key, "content")
-        assert await storage.exists(key)
         
         deleted = await storage.delete(key)
         assert deleted
@@ -124,9 +127,11 @@ class TestLocalStorageBackend:
         """
         storage = LocalStorageBackend(temp_dir)
         
-        await storage.store_text("dir1/file1.txt", "content1")
-        await storage.store_text("dir1/file2.txt", "content2")
-        await storage.store_text("dir2/file3.txt", "content3")
+        await asyncio.gather(
+            storage.store_text("dir1/file1.txt", "content1"),
+            storage.store_text("dir1/file2.txt", "content2"),
+            storage.store_text("dir2/file3.txt", "content3"),
+        )
         
         all_keys = await storage.list_keys()
         assert len(all_keys) == 3
@@ -154,6 +159,24 @@ class TestLocalStorageBackend:
         assert "hash" in meta
         assert "_stored_at" in meta
 
+    async def test_skip_metadata(self, temp_dir):
+        """Test storing content without a metadata sidecar.
+
+        Verifies that content stored with skip_metadata is readable but has
+        no metadata recorded and is still listed as a key.
+
+        Args:
+            temp_dir: Pytest fixture providing a temporary directory path.
+        """
+        storage = LocalStorageBackend(temp_dir)
+
+        key = "test/no_meta.txt"
+        await storage.store_text(key, "content", skip_metadata=True)
+
+        assert await storage.load_text(key) == "content"
+        assert await storage.get_metadata(key) == {}
+        assert await storage.list_keys("test") == [key]
+
     async def test_get_local_path(self, temp_dir):
         """Test getting local path.
 
@@ -168,9 +191,7 @@ class TestLocalStorageBackend:
         key = "test/path.txt"
         await storage.store_text(key, "content")
         
-        path = storage.get_local_path(key)
-        assert path is not None
-        assert path.exists()
+        assert storage.get_local_path(key) == storage._get_full_path(key)
         
         # Non-existent key returns None
         assert storage.get_local_path("nonexistent") is None
@@ -212,3 +233,54 @@ class TestLocalStorageBackend:
         path = storage.get_local_path(key)
         if path:
             assert str(temp_dir) in str(path)
+
+
+@pytest.mark.asyncio
+class TestInMemoryStorageBackend:
+    """Tests for in-memory storage."""
+
+    async def test_store_and_load(self, storage):
+        """Test storing and loading bytes, text, and models.
+
+        Args:
+            storage: Pytest fixture providing in-memory storage.
+        """
+        assert isinstance(storage, InMemoryStorageBackend)
+        model = ScreenModel(screen_id="s1", screen_name="Test Screen")
+
+        await asyncio.gather(
+            storage.store_bytes("test/data.bin", b"Hello, World!"),
+            storage.store_text("test/text.txt", "Hello, World!"),
+            storage.store_model("test/screen.json", model),
+        )
+
+        assert await storage.load_bytes("test/data.bin") == b"Hello, World!"
+        assert await storage.load_text("test/text.txt") == "Hello, World!"
+        assert await storage.load_model("test/screen.json", ScreenModel) == model
+        assert storage.get_local_path("test/data.bin") is None
+
+        with pytest.raises(FileNotFoundError):
+            await storage.load_bytes("nonexistent")
+
+    async def test_list_keys_and_delete(self, storage):
+        """Test prefix listing and deletion.
+
+        Verifies that prefixes match whole directories, like the local
+        backend, and that deleting a key also drops its metadata.
+
+        Args:
+            storage: Pytest fixture providing in-memory storage.
+        """
+        await asyncio.gather(
+            storage.store_text("dir1/file1.txt", "content1", {"author": "test"}),
+            storage.store_text("dir1/file2.txt", "content2"),
+            storage.store_text("dir10/file3.txt", "content3"),
+        )
+
+        assert len(await storage.list_keys()) == 3
+        assert await storage.list_keys("dir1") == ["dir1/file1.txt", "dir1/file2.txt"]
+        assert (await storage.get_metadata("dir1/file1.txt"))["author"] == "test"
+
+        assert await storage.delete("dir1/file1.txt")
+        assert not await storage.delete("dir1/file1.txt")
+        assert await storage.get_metadata("dir1/file1.txt") == {}